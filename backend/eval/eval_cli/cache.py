@@ -0,0 +1,35 @@
+"""
+On-disk cache helpers shared by the config, topic and trec_eval caches.
+"""
+
+import os
+from pathlib import Path
+
+
+def cache_dir() -> Path:
+    """Directory holding the eval CLI's on-disk caches."""
+    cache_home = os.getenv("XDG_CACHE_HOME")
+    base = Path(cache_home) if cache_home else Path.home() / ".cache"
+    return base / "eval_cli"
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """
+    Write data to path so concurrent readers never see a partial file.
+
+    Args:
+        path: Destination file; missing parent directories are created
+        data: Bytes to write
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    # Write to a per-process temp file and rename so readers never see partial data
+    tmp_file = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file.write_bytes(data)
+        os.replace(tmp_file, path)
+    except OSError:
+        tmp_file.unlink(missing_ok=True)
+        raise
@@ -90,33 +90,29 @@ class APIRetrievalClient:
                     f"   Original error: {str(e)}"
                 ) from e
 
-        # Parse response
+        # Parse and validate the raw body in one pass with pydantic-core's JSON parser
         try:
-            response_json = response.json()
-        except Exception as json_error:
-            request_url = getattr(response, "url", None) or (
-                response.request.url if hasattr(response, "request") else "unknown"
-            )
-            raise RuntimeError(
-                f"❌ Failed to parse API response as JSON\n"
-                f"   URL: {request_url}\n"
-                f"   Status: {response.status_code}\n"
-                f"   Response text (first 500 chars): {response.text[:500]}\n"
-                f"   JSON parse error: {json_error}"
-            ) from json_error
-
-        try:
-            api_response = RetrievalResponse(**response_json)
+            api_response = RetrievalResponse.from_json_bytes(response.content)
         except ValidationError as validation_error:
             request_url = getattr(response, "url", None) or (
                 response.request.url if hasattr(response, "request") else "unknown"
             )
+            if any(
+                error["type"] == "json_invalid" for error in validation_error.errors()
+            ):
+                raise RuntimeError(
+                    f"❌ Failed to parse API response as JSON\n"
+                    f"   URL: {request_url}\n"
+                    f"   Status: {response.status_code}\n"
+                    f"   Response text (first 500 chars): {response.text[:500]}\n"
+                    f"   JSON parse error: {validation_error}"
+                ) from validation_error
             raise RuntimeError(
                 f"❌ API response validation failed\n"
                 f"   URL: {request_url}\n"
                 f"   Status: {response.status_code}\n"
                 f"   Validation errors: {validation_error}\n"
-                f"   Response JSON (first 500 chars): {str(response_json)[:500]}"
+                f"   Response JSON (first 500 chars): {response.text[:500]}"
             ) from validation_error
 
         # Convert to dict keyed by query_id - each result maps to its own query_id
@@ -3,6 +3,7 @@ End-to-end evaluation pipeline commands.
 """
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -16,6 +17,7 @@ from eval_cli.config import Config
 from eval_cli.io.runs import build_trec_run, write_trec_run
 from eval_cli.io.topics import load_topics
 from eval_cli.models.runs import RunMetadata
+from eval_cli.models.topics import TopicSet
 from eval_cli.scoring.kpi_analyzer import KPIAnalyzer
 from eval_cli.scoring.trec_eval import TrecEvalWrapper
 
@@ -313,6 +315,85 @@ def benchmark(
     console.print(f"\n[green]✓ Benchmark completed: {run_id}[/green]")
 
 
+def _run_mode(
+    config: Config,
+    mode: str,
+    run_id: str,
+    mode_output_dir: Path,
+    topic_set: TopicSet,
+    topic_path: Path,
+    qrels_path: Path,
+    top_k: int,
+) -> dict:
+    """
+    Retrieve, score and report a single retrieval mode for run-all.
+
+    Returns:
+        Result entry for the comparison report
+
+    Raises:
+        RuntimeError: With a printable message if any step fails
+    """
+    console.print(f"[bold cyan]🔄 Running {mode.upper()} Mode...[/bold cyan]")
+
+    try:
+        client = APIRetrievalClient(config)
+        responses = client.retrieve_batch_sync(topic_set, mode, top_k)
+    except RuntimeError as e:
+        raise RuntimeError(f"API Error: {e}") from e
+    except Exception as e:
+        raise RuntimeError(f"Error generating responses for {mode}: {e}") from e
+
+    metadata = RunMetadata(
+        run_id=run_id,
+        config_snapshot=config.model_dump(),
+        topic_source=str(topic_path),
+        retrieval_mode=mode,
+        top_k=top_k,
+        num_queries=len(topic_set),
+    )
+
+    try:
+        trec_run = build_trec_run(responses, run_id, metadata)
+        run_file = mode_output_dir / f"{run_id}.tsv"
+        mode_output_dir.mkdir(parents=True, exist_ok=True)
+        write_trec_run(trec_run, run_file)
+    except Exception as e:
+        raise RuntimeError(f"Error building/writing TREC run for {mode}: {e}") from e
+
+    # Score
+    try:
+        trec_eval = TrecEvalWrapper(config)
+        metrics = trec_eval.evaluate(qrels_path, run_file)
+
+        # Analyze KPIs
+        analyzer = KPIAnalyzer(config)
+        report = analyzer.create_report(metrics)
+    except FileNotFoundError as e:
+        raise RuntimeError(f"Error: Qrels file not found: {e}") from e
+    except RuntimeError as e:
+        raise RuntimeError(f"Error during evaluation for {mode}: {e}") from e
+    except Exception as e:
+        raise RuntimeError(f"Error computing metrics for {mode}: {e}") from e
+
+    # Save KPI report
+    report_file = mode_output_dir / f"{run_id}_report.json"
+    try:
+        with open(report_file, "w", encoding="utf-8") as f:
+            json.dump(report.model_dump(), f, indent=2, default=str)
+    except OSError as e:
+        raise RuntimeError(f"Error writing report file for {mode}: {e}") from e
+
+    console.print(f"[green]✓ {mode.upper()} completed[/green]")
+
+    return {
+        "run_file": run_file,
+        "metrics": metrics,
+        "kpi_report": report.model_dump(),
+        "run_id": run_id,
+    }
+
+
 @app.command("run-all")
 def run_all_modes(
     topics: str = typer.Argument(..., help="Topic file (rag24, rag25)"),
@@ -348,107 +429,64 @@ def run_all_modes(
     console.print(f"[bold cyan]🧪 Multi-Mode Experiment: {experiment_name}[/bold cyan]")
     console.print(f"[dim]Output directory: {output_dir}[/dim]\n")
 
-    results = {}
-
-    for mode in modes:
-        console.print(f"[bold cyan]🔄 Running {mode.upper()} Mode...[/bold cyan]")
-
-        # Generate mode-specific experiment name
-        mode_experiment_name = f"{experiment_name}_{mode}"
-
-        # Run pipeline for this mode
-        run_id = mode_experiment_name
-        mode_output_dir = output_dir / mode
-
-        # Load topics
-        try:
-            if topics in config.paths.topics:
-                topic_path = config.get_data_path(config.paths.topics[topics])
-            else:
-                topic_path = Path(topics)
-
-            if not topic_path.exists():
-                console.print(f"[red]Error: Topic file not found: {topic_path}[/red]")
-                raise typer.Exit(1)
+    # Topics and qrels are shared by all modes, so resolve them once up front
+    try:
+        if topics in config.paths.topics:
+            topic_path = config.get_data_path(config.paths.topics[topics])
+        else:
+            topic_path = Path(topics)
 
-            topic_set = load_topics(topic_path)
-            client = APIRetrievalClient(config)
-            responses = client.retrieve_batch_sync(topic_set, mode, top_k)
-        except FileNotFoundError as e:
-            console.print(f"[red]Error: Topic file not found: {e}[/red]")
-            raise typer.Exit(1)
-        except RuntimeError as e:
-            console.print(f"[red]API Error: {e}[/red]")
-            raise typer.Exit(1)
-        except Exception as e:
-            console.print(
-                f"[red]Error loading topics or generating responses: {e}[/red]"
-            )
+        if not topic_path.exists():
+            console.print(f"[red]Error: Topic file not found: {topic_path}[/red]")
             raise typer.Exit(1)
 
-        metadata = RunMetadata(
-            run_id=run_id,
-            config_snapshot=config.model_dump(),
-            topic_source=str(topic_path),
-            retrieval_mode=mode,
-            top_k=top_k,
-            num_queries=len(topic_set),
-        )
+        topic_set = load_topics(topic_path)
+    except FileNotFoundError as e:
+        console.print(f"[red]Error: Topic file not found: {e}[/red]")
+        raise typer.Exit(1)
+    except typer.Exit:
+        raise
+    except Exception as e:
+        console.print(f"[red]Error loading topics: {e}[/red]")
+        raise typer.Exit(1)
 
-        try:
-            trec_run = build_trec_run(responses, run_id, metadata)
-            run_file = mode_output_dir / f"{run_id}.tsv"
-            mode_output_dir.mkdir(parents=True, exist_ok=True)
-            write_trec_run(trec_run, run_file)
-        except Exception as e:
-            console.print(f"[red]Error building/writing TREC run for {mode}: {e}[/red]")
-            raise typer.Exit(1)
+    qrels_rel_path = config.paths.qrels.get(topics)
+    if not qrels_rel_path:
+        available = list(config.paths.qrels.keys())
+        console.print(
+            f"[red]No qrels configured for topics='{topics}'. Available: {available}[/red]"
+        )
+        raise typer.Exit(1)
+    qrels_path = config.get_data_path(qrels_rel_path)
 
-        # Score
-        qrels_rel_path = config.paths.qrels.get(topics)
-        if not qrels_rel_path:
-            available = list(config.paths.qrels.keys())
-            console.print(
-                f"[red]No qrels configured for topics='{topics}'. Available: {available}[/red]"
+    # Modes are independent and dominated by API and trec_eval wait time,
+    # so run them concurrently and report every failure once all finish
+    with ThreadPoolExecutor(max_workers=len(modes)) as executor:
+        futures = {
+            mode: executor.submit(
+                _run_mode,
+                config,
+                mode,
+                f"{experiment_name}_{mode}",
+                output_dir / mode,
+                topic_set,
+                topic_path,
+                qrels_path,
+                top_k,
             )
-            raise typer.Exit(1)
-        qrels_path = config.get_data_path(qrels_rel_path)
-        try:
-            trec_eval = TrecEvalWrapper(config)
-            metrics = trec_eval.evaluate(qrels_path, run_file)
-
-            # Analyze KPIs
-            analyzer = KPIAnalyzer(config)
-            report = analyzer.create_report(metrics)
-        except FileNotFoundError as e:
-            console.print(f"[red]Error: Qrels file not found: {e}[/red]")
-            raise typer.Exit(1)
-        except RuntimeError as e:
-            console.print(f"[red]Error during evaluation for {mode}: {e}[/red]")
-            raise typer.Exit(1)
-        except Exception as e:
-            console.print(f"[red]Error computing metrics for {mode}: {e}[/red]")
-            raise typer.Exit(1)
-
-        # Save KPI report
-        report_file = mode_output_dir / f"{run_id}_report.json"
-        report_file.parent.mkdir(parents=True, exist_ok=True)
-        try:
-            with open(report_file, "w", encoding="utf-8") as f:
-                json.dump(report.model_dump(), f, indent=2, default=str)
-        except OSError as e:
-            console.print(f"[red]Error writing report file for {mode}: {e}[/red]")
-            raise typer.Exit(1)
-
-        # Save results
-        results[mode] = {
-            "run_file": run_file,
-            "metrics": metrics,
-            "kpi_report": report.model_dump(),
-            "run_id": run_id,
+            for mode in modes
         }
 
-        console.print(f"[green]✓ {mode.upper()} completed[/green]")
+    results = {}
+    failed = False
+    for mode, future in futures.items():
+        try:
+            results[mode] = future.result()
+        except Exception as e:
+            console.print(f"[red]{e}[/red]")
+            failed = True
+    if failed:
+        raise typer.Exit(1)
 
     # Generate comparison report
     console.print("[bold cyan]📊 Generating comparison report...[/bold cyan]")
@@ -4,6 +4,7 @@ TREC run management commands.
 
 import json
 from collections import Counter
+from operator import attrgetter
 from pathlib import Path
 
 import typer
@@ -180,7 +181,7 @@ def info(
 
     try:
         # Count queries and documents using Counter
-        query_counts = Counter(row.query_id for row in trec_run.rows)
+        query_counts = Counter(map(attrgetter("query_id"), trec_run.rows))
 
         table = Table(title="TREC Run Information")
         table.add_column("Metric", style="cyan")
@@ -2,19 +2,77 @@
 Configuration management for the evaluation CLI.
 """
 
+import contextlib
+import functools
+import hashlib
+import json
+import os
 from pathlib import Path
 from typing import Any, Literal
 
-import yaml
-from pydantic import BaseModel, Field, SecretStr
+from pydantic import BaseModel, ConfigDict, Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from eval_cli.cache import atomic_write_bytes, cache_dir
+
 RetrievalMode = Literal["lexical", "vector", "hybrid"]
 
 
+def _parse_config_yaml(config_path: Path) -> dict[str, Any]:
+    """Parse a YAML config file, preferring the LibYAML loader."""
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(config_path, encoding="utf-8") as f:
+        return yaml.load(f, Loader=loader)
+
+
+def _read_config_cached(config_path: Path) -> dict[str, Any]:
+    """
+    Parse a YAML config file, reusing a JSON snapshot when it is unchanged.
+
+    Snapshots are keyed by the resolved path, modification time and size, so
+    any edit to the YAML file produces a cache miss. Cache I/O failures are
+    ignored and simply fall back to parsing the YAML file.
+    """
+    stat = config_path.stat()
+    key = hashlib.blake2b(
+        f"{config_path.resolve()}:{stat.st_mtime_ns}:{stat.st_size}".encode(),
+        digest_size=16,
+    ).hexdigest()
+    cache_file = cache_dir() / f"{key}.json"
+
+    try:
+        return json.loads(cache_file.read_bytes())
+    except (OSError, ValueError):
+        pass
+
+    config_data = _parse_config_yaml(config_path)
+
+    # Read-only cache dir or non-JSON YAML values: skip caching
+    with contextlib.suppress(OSError, TypeError, ValueError):
+        atomic_write_bytes(cache_file, json.dumps(config_data).encode())
+
+    return config_data
+
+
+def _read_config_data(config_path: Path) -> dict[str, Any]:
+    """
+    Parse a YAML config file.
+
+    Set EVAL_CLI_CONFIG_CACHE=1 to reuse a JSON snapshot of the parsed file
+    across runs; PyYAML is then only imported when the file has changed.
+    """
+    if os.getenv("EVAL_CLI_CONFIG_CACHE", "").lower() in ("1", "true", "yes"):
+        return _read_config_cached(config_path)
+    return _parse_config_yaml(config_path)
+
+
 class APIConfig(BaseModel):
     """API configuration."""
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     base_url: str = Field(default="http://localhost:8000", description="API base URL")
     api_key: SecretStr | None = Field(
         default=None, description="API key for authentication"
@@ -27,6 +85,8 @@ class APIConfig(BaseModel):
 class CLIRetrievalConfig(BaseModel):
     """CLI retrieval configuration (different from shared RetrievalConfig)."""
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     top_k: int = Field(default=100, alias="top_k")
     mode: RetrievalMode = "hybrid"
 
@@ -34,6 +94,8 @@ class CLIRetrievalConfig(BaseModel):
 class PathsConfig(BaseModel):
     """Path configuration."""
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     project_root: str | None = None
     data_dir: str = ".data/trec_rag_assets"
     output_dir: str = "backend/eval/artifacts"
@@ -45,6 +107,8 @@ class PathsConfig(BaseModel):
 class PerformanceLevel(BaseModel):
     """Performance level configuration."""
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     ndcg_10: float
     map_100: float
     mrr_10: float
@@ -53,6 +117,8 @@ class PerformanceLevel(BaseModel):
 class ScoreGeneration(BaseModel):
     """Score generation parameters."""
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     seed: int = 42
     score_range: tuple[float, float] = (0.0, 1.0)
     relevance_bias: float = 0.3
@@ -62,6 +128,8 @@ class ScoreGeneration(BaseModel):
 class MockConfig(BaseModel):
     """Mock system configuration."""
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     performance_levels: dict[str, PerformanceLevel] = Field(default_factory=dict)
     score_generation: ScoreGeneration = Field(default_factory=ScoreGeneration)
 
@@ -69,6 +137,8 @@ class MockConfig(BaseModel):
 class MetricsConfig(BaseModel):
     """Metrics configuration."""
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     primary: str = "ndcg_cut_10"
     cutoffs: list[int] = [10, 25, 50, 100]
     targets: dict[str, float] = Field(default_factory=dict)
@@ -78,6 +148,8 @@ class MetricsConfig(BaseModel):
 class TrecEvalConfig(BaseModel):
     """trec_eval configuration."""
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     binary_path: str = "trec_eval"
     flags: list[str] = ["-c"]
     metrics: list[str] = Field(default_factory=list)
@@ -86,6 +158,8 @@ class TrecEvalConfig(BaseModel):
 class LoggingConfig(BaseModel):
     """Logging configuration."""
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     level: str = "INFO"
     format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
@@ -99,6 +173,8 @@ class Config(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",  # Ignore extra fields from .env
+        frozen=True,  # Treated as read-only once loaded
+        defer_build=True,  # Build validators on first load, not on import
     )
 
     # Load API key directly from .env
@@ -117,8 +193,6 @@ class Config(BaseSettings):
         """Load configuration from YAML file and environment variables."""
         if config_path is None:
             # First check environment variable
-            import os
-
             env_config_path = os.getenv("EVAL_CONFIG_PATH")
             if env_config_path:
                 config_path = Path(env_config_path)
@@ -144,13 +218,10 @@ class Config(BaseSettings):
                 "Please set EVAL_CONFIG_PATH environment variable or provide explicit config_path."
             )
 
-        with open(config_path, encoding="utf-8") as f:
-            config_data = yaml.safe_load(f)
+        config_data = _read_config_data(config_path)
 
         # Auto-detect project root if not set
         if not config_data.get("paths", {}).get("project_root"):
-            import os
-
             # First check environment variable
             env_project_root = os.getenv("PROJECT_ROOT")
             if env_project_root:
@@ -192,23 +263,32 @@ class Config(BaseSettings):
         # Create config instance
         config_instance = cls(**config_data)
 
+        # Config is frozen, so apply the .env/environment API overrides via copies
+        api_overrides: dict[str, Any] = {}
+
         # Inject API key from .env into nested api config
         if config_instance.api_key:
-            config_instance.api.api_key = (
-                config_instance.api_key
-            )  # SecretStr is copied directly
+            api_overrides["api_key"] = config_instance.api_key  # SecretStr copied
 
         # Override API base URL from environment variable if set
-        import os
-
         if api_base_url := os.getenv("API_BASE_URL"):
-            config_instance.api.base_url = api_base_url
+            api_overrides["base_url"] = api_base_url
+
+        if api_overrides:
+            config_instance = config_instance.model_copy(
+                update={"api": config_instance.api.model_copy(update=api_overrides)}
+            )
 
         return config_instance
 
     @staticmethod
+    @functools.cache
     def _find_project_root() -> Path:
-        """Find project root by looking for 'shared' and 'backend' directories."""
+        """Find project root by looking for 'shared' and 'backend' directories.
+
+        The walk starts from this module's location, so the result is fixed for
+        the process and memoized to avoid repeated stat calls.
+        """
         current = Path(__file__).parent
 
         # Walk up directories looking for project root
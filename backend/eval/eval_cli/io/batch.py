@@ -0,0 +1,78 @@
+"""
+Multi-file loading utilities.
+"""
+
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from eval_cli.io.qrels import Qrels, load_qrels
+from eval_cli.io.runs import read_trec_run
+from eval_cli.io.topics import load_topics
+from eval_cli.models.runs import TrecRun
+from eval_cli.models.topics import TopicSet
+
+# Below this many input bytes, process pool start-up costs more than it saves
+_PARALLEL_MIN_BYTES = 16 * 1024 * 1024
+
+
+def _total_size(paths: Sequence[Path]) -> int:
+    """Sum the sizes of the given files, ignoring missing ones."""
+    total = 0
+    for path in paths:
+        try:
+            total += path.stat().st_size
+        except OSError:
+            continue
+    return total
+
+
+def load_all(
+    topic_paths: Sequence[Path] = (),
+    qrels_paths: Sequence[Path] = (),
+    run_paths: Sequence[Path] = (),
+) -> tuple[
+    dict[Path, TopicSet],
+    dict[Path, tuple[Qrels, dict[str, int]]],
+    dict[Path, TrecRun],
+]:
+    """
+    Load topic, qrels and run files, in parallel when the input is large.
+
+    Each file is parsed independently, so once the combined size exceeds
+    a threshold the loaders run in a process pool; smaller inputs are
+    loaded sequentially. Loader exceptions propagate unchanged.
+
+    Args:
+        topic_paths: Topic files to load with load_topics
+        qrels_paths: Qrels files to load with load_qrels
+        run_paths: TREC run files to load with read_trec_run
+
+    Returns:
+        Tuple of (topics, qrels, runs) dicts keyed by input path
+    """
+    jobs: list[tuple[dict[Path, Any], Callable[[Path], Any], Path]] = []
+    topics: dict[Path, TopicSet] = {}
+    qrels: dict[Path, tuple[Qrels, dict[str, int]]] = {}
+    runs: dict[Path, TrecRun] = {}
+    jobs.extend((topics, load_topics, path) for path in topic_paths)
+    jobs.extend((qrels, load_qrels, path) for path in qrels_paths)
+    jobs.extend((runs, read_trec_run, path) for path in run_paths)
+
+    paths = [path for _, _, path in jobs]
+    if len(jobs) < 2 or _total_size(paths) < _PARALLEL_MIN_BYTES:
+        for results, loader, path in jobs:
+            results[path] = loader(path)
+        return topics, qrels, runs
+
+    max_workers = min(len(jobs), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            (results, path, executor.submit(loader, path))
+            for results, loader, path in jobs
+        ]
+        for results, path, future in futures:
+            results[path] = future.result()
+    return topics, qrels, runs
@@ -0,0 +1,29 @@
+"""
+Raw line reading utilities.
+"""
+
+import mmap
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+
+def iter_lines(file_path: Path) -> Iterator[bytes]:
+    """
+    Yield the raw lines of a file, including line endings.
+
+    The file is memory-mapped, so large qrels/run files are read without
+    Python's buffered text layer and callers only decode the fields they keep.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Iterator over the file's lines as bytes
+    """
+    with open(file_path, "rb") as f:
+        # Empty files cannot be memory-mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield from iter(mm.readline, b"")
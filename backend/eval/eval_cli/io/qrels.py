@@ -2,25 +2,38 @@
 Qrels loading and parsing utilities.
 """
 
+import csv
 import logging
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Annotated
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
+
+from eval_cli.io.lines import iter_lines
 
 logger = logging.getLogger(__name__)
 
 
-class QrelEntry(BaseModel):
-    """Single qrel entry."""
+@dataclass(slots=True, frozen=True)
+class QrelEntry:
+    """Single qrel entry.
+
+    A slotted dataclass rather than a BaseModel, since qrels files hold many
+    entries. The relevance constraint applies when entries are validated
+    through pydantic (e.g. the qrels TypeAdapter).
+    """
 
     query_id: str
     doc_id: str
-    relevance: int = Field(ge=0, description="Relevance must be non-negative")
+    relevance: Annotated[int, Field(ge=0, description="Relevance must be non-negative")]
 
 
 class Qrels(BaseModel):
     """Collection of relevance judgements."""
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     entries: list[QrelEntry]
 
     def get_relevant_docs(self, query_id: str) -> set[str]:
@@ -44,10 +57,141 @@ class Qrels(BaseModel):
         return {entry.query_id for entry in self.entries}
 
 
+# Reused across calls so the list[QrelEntry] schema is only built once
+_QREL_ENTRIES_ADAPTER = TypeAdapter(list[QrelEntry])
+
+# Per-file cap on individually logged bad lines; the rest go into a summary
+_MAX_LINE_WARNINGS = 20
+
+
+def _parse_qrels_vectorized(file_path: Path) -> list[QrelEntry] | None:
+    """
+    Parse a well-formed qrels file with pandas' C tokenizer.
+
+    Returns None when the file is irregular (short/long lines, blank lines,
+    non-integer or negative relevance) so the caller can fall back to the
+    line-by-line parser, which reports those problems in detail.
+    """
+    import pandas as pd
+
+    try:
+        frame = pd.read_csv(
+            file_path,
+            sep=r"\s+",
+            header=None,
+            dtype=str,
+            na_filter=False,
+            skip_blank_lines=False,
+            index_col=False,
+            quoting=csv.QUOTE_NONE,
+            encoding="utf-8",
+            memory_map=True,
+        )
+    except ValueError:
+        # Covers ParserError, EmptyDataError and UnicodeDecodeError
+        return None
+
+    if frame.shape[1] not in (3, 4) or (frame == "").to_numpy().any():
+        return None
+
+    if frame.shape[1] == 4:
+        try:
+            relevance = frame[3].astype("int64")
+        except (ValueError, OverflowError):
+            # Non-integer grades, or integers outside the int64 range
+            return None
+        if (relevance < 0).any():
+            return None
+        grades = relevance.tolist()
+    else:
+        grades = [1] * len(frame)
+
+    # Values were validated column-wise above, so skip per-row validation
+    return [
+        QrelEntry(query_id=query_id, doc_id=doc_id, relevance=grade)
+        for query_id, doc_id, grade in zip(
+            frame[0].tolist(), frame[2].tolist(), grades, strict=True
+        )
+    ]
+
+
+def _parse_qrels_lines(file_path: Path, stats: dict[str, int]) -> list[QrelEntry]:
+    """Parse a qrels file line by line, tracking malformed lines in stats."""
+    raw_entries = []
+    line_nums = []
+    # Skip formatting warnings entirely when they would not be emitted
+    warn_limit = _MAX_LINE_WARNINGS if logger.isEnabledFor(logging.WARNING) else 0
+    for line_num, line in enumerate(iter_lines(file_path), 1):
+        parts = line.split()
+        if len(parts) < 3:
+            # Track malformed lines
+            stats["malformed"] += 1
+            if stats["malformed"] + stats["invalid_relevance"] <= warn_limit:
+                logger.warning(
+                    f"Malformed qrels line {line_num} in {file_path}: "
+                    f"expected at least 3 fields, got {len(parts)}. "
+                    f"Line: {line[:100].decode('utf-8', errors='replace')}"
+                )
+            continue
+        try:
+            relevance = int(parts[3]) if len(parts) > 3 else 1
+        except ValueError as e:
+            # Track lines with non-integer relevance
+            stats["invalid_relevance"] += 1
+            if stats["malformed"] + stats["invalid_relevance"] <= warn_limit:
+                logger.warning(
+                    f"Invalid relevance value on line {line_num} in {file_path}: "
+                    f"{e}. Line: {line[:100].decode('utf-8', errors='replace')}"
+                )
+            continue
+        raw_entries.append(
+            {
+                "query_id": parts[0].decode("utf-8"),
+                "doc_id": parts[2].decode("utf-8"),
+                "relevance": relevance,
+            }
+        )
+        line_nums.append(line_num)
+
+    # Validate all entries in a single pass through the cached adapter
+    try:
+        entries = _QREL_ENTRIES_ADAPTER.validate_python(raw_entries)
+    except ValidationError as e:
+        invalid = {}
+        for error in e.errors():
+            invalid.setdefault(error["loc"][0], error["msg"])
+
+        for index, msg in sorted(invalid.items()):
+            # Track lines whose relevance fails QrelEntry validation (e.g. negative)
+            stats["invalid_relevance"] += 1
+            if stats["malformed"] + stats["invalid_relevance"] <= warn_limit:
+                logger.warning(
+                    f"Invalid relevance value on line {line_nums[index]} in "
+                    f"{file_path}: {msg}. Entry: {raw_entries[index]}"
+                )
+        entries = _QREL_ENTRIES_ADAPTER.validate_python(
+            [entry for i, entry in enumerate(raw_entries) if i not in invalid]
+        )
+
+    issues = stats["malformed"] + stats["invalid_relevance"]
+    if warn_limit and issues > warn_limit:
+        logger.warning(
+            f"Skipped {issues} bad line(s) in qrels file {file_path} "
+            f"({stats['malformed']} malformed, {stats['invalid_relevance']} "
+            f"invalid relevance); only the first {warn_limit} were logged"
+        )
+    return entries
+
+
 def load_qrels(file_path: Path) -> tuple[Qrels, dict[str, int]]:
     """
     Load TREC qrels file.
 
+    Well-formed files are parsed in bulk with pandas; files containing
+    malformed lines fall back to a line-by-line parser so every problem
+    is counted and logged. Both parsers only yield checked entries, so the
+    returned Qrels is built without revalidating them.
+
     Args:
         file_path: Path to the qrels file
 
@@ -57,41 +201,16 @@ def load_qrels(file_path: Path) -> tuple[Qrels, dict[str, int]]:
         - 'malformed': count of lines with fewer than 3 fields
         - 'invalid_relevance': count of lines with non-integer relevance values
     """
-    entries = []
     stats = {"malformed": 0, "invalid_relevance": 0}
 
     try:
-        with open(file_path, encoding="utf-8") as f:
-            for line_num, line in enumerate(f, 1):
-                parts = line.strip().split()
-                if len(parts) < 3:
-                    # Track malformed lines
-                    stats["malformed"] += 1
-                    logger.warning(
-                        f"Malformed qrels line {line_num} in {file_path}: "
-                        f"expected at least 3 fields, got {len(parts)}. Line: {line[:100]}"
-                    )
-                    continue
-                try:
-                    relevance = int(parts[3]) if len(parts) > 3 else 1
-                    entry = QrelEntry(
-                        query_id=parts[0],
-                        doc_id=parts[2],
-                        relevance=relevance,
-                    )
-                    entries.append(entry)
-                except ValueError as e:
-                    # Track lines with non-integer relevance
-                    stats["invalid_relevance"] += 1
-                    logger.warning(
-                        f"Invalid relevance value on line {line_num} in {file_path}: {e}. "
-                        f"Line: {line[:100]}"
-                    )
-                    continue
+        entries = _parse_qrels_vectorized(file_path)
+        if entries is None:
+            entries = _parse_qrels_lines(file_path, stats)
     except FileNotFoundError:
         raise FileNotFoundError(f"Qrels file not found: {file_path}")
     except OSError as e:
         raise RuntimeError(f"Error reading qrels file {file_path}: {e}")
 
-    qrels = Qrels(entries=entries)
+    qrels = Qrels.model_construct(entries=entries)
     return qrels, stats
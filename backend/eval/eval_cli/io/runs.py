@@ -2,35 +2,63 @@
 TREC run building and I/O utilities.
 """
 
+import csv
 import logging
+import math
+import sys
+from collections import Counter
+from itertools import islice
+from operator import attrgetter
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from shared.retrieval.response import QueryResult
 
+from eval_cli.io.lines import iter_lines
 from eval_cli.models.runs import RunMetadata, TrecRun, TrecRunRow
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
+# TREC limits runs to 100 results per query
+_MAX_RESULTS_PER_QUERY = 100
+
+# Rows formatted per write call in write_trec_run
+_WRITE_CHUNK_ROWS = 10_000
+
 
 def build_trec_run(
     responses: dict[str, QueryResult],
     run_id: str,
     metadata: RunMetadata,
 ) -> TrecRun:
-    """Convert retrieval responses to TREC run."""
-    rows = []
+    """Convert retrieval responses to TREC run (top 100 segments per query)."""
+    # Size the row list up front and fill it in place
+    rows = [None] * sum(
+        min(len(qr.segments), _MAX_RESULTS_PER_QUERY) for qr in responses.values()
+    )
+    index = 0
 
     for query_id, query_result in responses.items():
-        # Extract segments from QueryResult
-        for rank, segment in enumerate(query_result.segments[:100], start=1):
-            row = TrecRunRow(
+        # Extract segments from QueryResult without copying the list
+        segments = islice(query_result.segments, _MAX_RESULTS_PER_QUERY)
+        for rank, segment in enumerate(segments, start=1):
+            # Ranks come from enumerate, so only the score needs checking
+            if not math.isfinite(segment.score):
+                raise ValueError(
+                    f"Non-finite score {segment.score} for query {query_id}, "
+                    f"segment {segment.segment_id}"
+                )
+            rows[index] = TrecRunRow(
                 query_id=query_id,
                 doc_id=segment.segment_id,
                 rank=rank,
                 score=segment.score,
                 run_id=run_id,
             )
-            rows.append(row)
+            index += 1
 
     return TrecRun(rows=rows, metadata=metadata)
 
@@ -43,9 +71,12 @@ def write_trec_run(run: TrecRun, output_path: Path) -> None:
         raise RuntimeError(f"Failed to create output directory for {output_path}: {e}")
 
     try:
-        with open(output_path, "w", encoding="utf-8") as f:
-            for row in run.rows:
-                f.write(row.to_trec_line() + "\n")
+        rows = run.rows
+        with open(output_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            # Join rows in bounded chunks so each chunk is a single write call
+            for start in range(0, len(rows), _WRITE_CHUNK_ROWS):
+                chunk = rows[start : start + _WRITE_CHUNK_ROWS]
+                f.write("".join([row.to_trec_line() + "\n" for row in chunk]))
         logger.info(
             f"Successfully wrote TREC run to {output_path} with {len(run.rows)} rows"
         )
@@ -53,38 +84,149 @@ def write_trec_run(run: TrecRun, output_path: Path) -> None:
         raise RuntimeError(f"Failed to write run file to {output_path}: {e}")
 
 
-def read_trec_run(file_path: Path, run_id: str = "unknown") -> TrecRun:
-    """Read TREC run from TSV file."""
+def _intern_all(values: list[str]) -> list[str]:
+    """
+    Replace repeated strings with one interned object per distinct value.
+
+    Used for low-cardinality columns (query IDs, Q0, run IDs), so rows share
+    string objects instead of each holding its own copy.
+    """
+    interned = {value: sys.intern(value) for value in set(values)}
+    return list(map(interned.__getitem__, values))
+
+
+def _read_run_frame(file_path: Path) -> "pd.DataFrame | None":
+    """
+    Read a well-formed TREC run file with pandas' C tokenizer.
+
+    Returns None when any line is irregular (wrong column count, empty
+    fields, non-numeric/non-positive rank, non-finite score) so the caller
+    can fall back to the line-by-line parser, which logs each bad line.
+    Rank and score columns are converted to int64 and float64.
+    """
+    import numpy as np
+    import pandas as pd
+
+    try:
+        frame = pd.read_csv(
+            file_path,
+            sep="\t",
+            header=None,
+            dtype=str,
+            na_filter=False,
+            skip_blank_lines=False,
+            index_col=False,
+            quoting=csv.QUOTE_NONE,
+            encoding="utf-8",
+            memory_map=True,
+        )
+    except ValueError:
+        # Covers ParserError, EmptyDataError and UnicodeDecodeError
+        return None
+
+    if frame.shape[1] != 6 or (frame == "").to_numpy().any():
+        return None
+
+    try:
+        frame[3] = frame[3].astype("int64")
+        frame[4] = frame[4].astype("float64")
+    except (ValueError, OverflowError):
+        # Non-numeric values, or ranks outside the int64 range
+        return None
+    if (frame[3] <= 0).any() or not np.isfinite(frame[4].to_numpy()).all():
+        return None
+
+    return frame
+
+
+def _parse_run_vectorized(file_path: Path) -> list[TrecRunRow] | None:
+    """Parse a well-formed TREC run file into rows, or None if irregular."""
+    frame = _read_run_frame(file_path)
+    if frame is None:
+        return None
+
+    # Match the line parser, which strips surrounding whitespace per line
+    query_ids = _intern_all(frame[0].str.lstrip().tolist())
+    run_ids = _intern_all(frame[5].str.rstrip().tolist())
+
+    # Values were validated column-wise above, so skip per-row validation
+    return [
+        TrecRunRow(
+            query_id=query_id,
+            q0=q0,
+            doc_id=doc_id,
+            rank=rank,
+            score=score,
+            run_id=row_run_id,
+        )
+        for query_id, q0, doc_id, rank, score, row_run_id in zip(
+            query_ids,
+            _intern_all(frame[1].tolist()),
+            frame[2].tolist(),
+            frame[3].tolist(),
+            frame[4].tolist(),
+            run_ids,
+            strict=True,
+        )
+    ]
+
+
+def _parse_run_lines(file_path: Path) -> tuple[list[TrecRunRow], int]:
+    """Parse a TREC run file line by line, returning (rows, skipped_lines)."""
     rows = []
     skipped_lines = 0
+    # Skip formatting warnings entirely when they would not be emitted
+    warn_enabled = logger.isEnabledFor(logging.WARNING)
+    for line_num, line in enumerate(iter_lines(file_path), 1):
+        parts = line.strip().split(b"\t")
+        if len(parts) != 6:
+            skipped_lines += 1
+            if warn_enabled:
+                logger.warning(
+                    f"Skipping malformed line {line_num} in {file_path}: "
+                    f"expected 6 columns, got {len(parts)}. "
+                    f"Line: {line[:100].decode('utf-8', errors='replace')}"
+                )
+            continue
+        try:
+            rank = int(parts[3])
+            score = float(parts[4])
+            # Enforce TrecRunRow's field constraints before direct construction
+            if rank <= 0:
+                raise ValueError(f"rank must be greater than 0, got {rank}")
+            if not math.isfinite(score):
+                raise ValueError(f"score must be a finite number, got {score}")
+            row = TrecRunRow(
+                query_id=sys.intern(parts[0].decode("utf-8")),
+                q0=sys.intern(parts[1].decode("utf-8")),
+                doc_id=parts[2].decode("utf-8"),
+                rank=rank,
+                score=score,
+                run_id=sys.intern(parts[5].decode("utf-8")),
+            )
+            rows.append(row)
+        except (ValueError, IndexError) as e:
+            skipped_lines += 1
+            if warn_enabled:
+                logger.warning(
+                    f"Skipping malformed line {line_num} in {file_path}: {e}. "
+                    f"Line: {line[:100].decode('utf-8', errors='replace')}"
+                )
+            continue
+    return rows, skipped_lines
+
+
+def read_trec_run(file_path: Path, run_id: str = "unknown") -> TrecRun:
+    """Read TREC run from TSV file.
+
+    Well-formed files are parsed in bulk with pandas; files containing
+    malformed lines fall back to a line-by-line parser that skips and logs them.
+    """
+    skipped_lines = 0
     try:
-        with open(file_path, encoding="utf-8") as f:
-            for line_num, line in enumerate(f, 1):
-                parts = line.strip().split("\t")
-                if len(parts) != 6:
-                    skipped_lines += 1
-                    logger.warning(
-                        f"Skipping malformed line {line_num} in {file_path}: "
-                        f"expected 6 columns, got {len(parts)}. Line: {line[:100]}"
-                    )
-                    continue
-                try:
-                    row = TrecRunRow(
-                        query_id=parts[0],
-                        q0=parts[1],
-                        doc_id=parts[2],
-                        rank=int(parts[3]),
-                        score=float(parts[4]),
-                        run_id=parts[5],
-                    )
-                    rows.append(row)
-                except (ValueError, IndexError) as e:
-                    skipped_lines += 1
-                    logger.warning(
-                        f"Skipping malformed line {line_num} in {file_path}: {e}. "
-                        f"Line: {line[:100]}"
-                    )
-                    continue
+        rows = _parse_run_vectorized(file_path)
+        if rows is None:
+            rows, skipped_lines = _parse_run_lines(file_path)
     except FileNotFoundError:
         raise FileNotFoundError(f"Run file not found: {file_path}")
     except OSError as e:
@@ -111,3 +253,31 @@ def read_trec_run(file_path: Path, run_id: str = "unknown") -> TrecRun:
     )
 
     return TrecRun(rows=rows, metadata=metadata)
+
+
+def read_run_query_counts(file_path: Path) -> dict[str, int]:
+    """
+    Count results per query in a TREC run file.
+
+    Well-formed files are counted directly on the pandas query_id column
+    without building TrecRunRow objects; other files go through the
+    line-by-line parser, so malformed lines are skipped as in read_trec_run.
+
+    Args:
+        file_path: Path to the TREC run file
+
+    Returns:
+        Dict mapping query_id to its number of results
+    """
+    try:
+        frame = _read_run_frame(file_path)
+        if frame is not None:
+            # Match the line parser, which strips surrounding whitespace per line
+            return frame[0].str.lstrip().value_counts(sort=False).to_dict()
+        rows, _ = _parse_run_lines(file_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Run file not found: {file_path}")
+    except OSError as e:
+        raise RuntimeError(f"Error reading run file {file_path}: {e}")
+
+    return dict(Counter(map(attrgetter("query_id"), rows)))
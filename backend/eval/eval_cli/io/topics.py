@@ -2,42 +2,99 @@
 Topic loading and parsing utilities.
 """
 
+import contextlib
+import hashlib
 import json
 import logging
+import os
+import pickle
+import re
 from pathlib import Path
 
+from pydantic import TypeAdapter, ValidationError
+
+from eval_cli.cache import atomic_write_bytes, cache_dir
+from eval_cli.io.lines import iter_lines
 from eval_cli.models.topics import Topic, TopicSet
 
 logger = logging.getLogger(__name__)
 
+try:
+    # orjson is optional; both parsers accept bytes and raise JSONDecodeError
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
-def load_jsonl_topics(file_path: Path) -> TopicSet:
-    """Load topics from JSONL format (2025 style)."""
+
+# Validates a whole list of topic dicts in a single pydantic-core call
+_TOPIC_LIST_ADAPTER = TypeAdapter(list[Topic])
+
+# Larger JSONL topic files are streamed line by line instead of read at once
+_JSONL_BATCH_MAX_BYTES = 100 * 1024 * 1024
+
+
+def _parse_jsonl_topics_batch(buffer: bytes) -> list[Topic] | None:
+    """
+    Parse a well-formed JSONL topic buffer in one pass.
+
+    Returns None if any line is blank, invalid JSON or fails topic
+    validation, so the caller can fall back to the line parser for reporting.
+    """
+    try:
+        # Topic files are user input, so validate the whole batch in one call
+        return _TOPIC_LIST_ADAPTER.validate_python(
+            list(map(_json_loads, buffer.splitlines()))
+        )
+    except (json.JSONDecodeError, ValidationError):
+        return None
+
+
+def _parse_jsonl_topics_lines(file_path: Path) -> list[Topic]:
+    """Parse a JSONL topic file line by line, skipping and logging bad lines."""
     topics = []
+    # Skip formatting warnings entirely when they would not be emitted
+    warn_enabled = logger.isEnabledFor(logging.WARNING)
+    for line_num, line in enumerate(iter_lines(file_path), 1):
+        if not line.strip():
+            continue
+        try:
+            data = _json_loads(line)
+            topic = Topic(
+                query_id=data["query_id"],
+                query=data["query"],
+                narrative=data.get("narrative"),
+                question=data.get("question"),
+            )
+            topics.append(topic)
+        except json.JSONDecodeError as e:
+            if warn_enabled:
+                logger.warning(
+                    f"Invalid JSON on line {line_num} in {file_path}: {e}. "
+                    f"Line: {line[:100].decode('utf-8', errors='replace')}"
+                )
+            continue
+        except KeyError as e:
+            if warn_enabled:
+                logger.warning(
+                    f"Missing required field on line {line_num} in {file_path}: "
+                    f"{e}. Line: {line[:100].decode('utf-8', errors='replace')}"
+                )
+            continue
+    return topics
+
+
+def load_jsonl_topics(file_path: Path) -> TopicSet:
+    """Load topics from JSONL format (2025 style).
+
+    Files up to 100 MB are read at once and parsed in a single pass; larger
+    files, and files containing bad lines, go through the line parser.
+    """
     try:
-        with open(file_path, encoding="utf-8") as f:
-            for line_num, line in enumerate(f, 1):
-                try:
-                    data = json.loads(line)
-                    topic = Topic(
-                        query_id=data["query_id"],
-                        query=data["query"],
-                        narrative=data.get("narrative"),
-                        question=data.get("question"),
-                    )
-                    topics.append(topic)
-                except json.JSONDecodeError as e:
-                    logger.warning(
-                        f"Invalid JSON on line {line_num} in {file_path}: {e}. "
-                        f"Line: {line[:100]}"
-                    )
-                    continue
-                except KeyError as e:
-                    logger.warning(
-                        f"Missing required field on line {line_num} in {file_path}: {e}. "
-                        f"Line: {line[:100]}"
-                    )
-                    continue
+        topics = None
+        if file_path.stat().st_size <= _JSONL_BATCH_MAX_BYTES:
+            topics = _parse_jsonl_topics_batch(file_path.read_bytes())
+        if topics is None:
+            topics = _parse_jsonl_topics_lines(file_path)
     except FileNotFoundError:
         raise
     except OSError as e:
@@ -46,114 +103,215 @@ def load_jsonl_topics(file_path: Path) -> TopicSet:
     return TopicSet(topics=topics, source_file=str(file_path), format="jsonl")
 
 
-def load_simple_topics(file_path: Path) -> TopicSet:
-    """Load topics from simple tab-separated format (query_id\tquery_text)."""
-    topics = []
-
+def _read_topics_text(file_path: Path) -> str:
+    """Read a whole topics file as text."""
     try:
-        with open(file_path, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-
-                parts = line.split("\t", 1)
-                if len(parts) == 2:
-                    query_id, query_text = parts
-                    topic = Topic(
-                        query_id=query_id.strip(),
-                        query=query_text.strip(),
-                        narrative="",
-                    )
-                    topics.append(topic)
-                else:
-                    logger.warning(
-                        f"Malformed line in simple topics file {file_path} "
-                        f"(expected tab-separated query_id and query): {line[:100]}"
-                    )
+        return file_path.read_text(encoding="utf-8")
     except FileNotFoundError:
         raise
     except OSError as e:
         raise RuntimeError(f"Error reading topics file {file_path}: {e}") from e
 
-    return TopicSet(topics=topics, source_file=str(file_path), format="simple")
 
+def load_simple_topics(file_path: Path, content: str | None = None) -> TopicSet:
+    """Load topics from simple tab-separated format (query_id\tquery_text).
+
+    Args:
+        file_path: Path to the topics file
+        content: File content if already read; read from file_path when omitted
+    """
+    if content is None:
+        content = _read_topics_text(file_path)
+
+    topics = []
+    warn_enabled = logger.isEnabledFor(logging.WARNING)
+    for line in content.split("\n"):
+        line = line.strip()
+        if not line:
+            continue
+
+        parts = line.split("\t", 1)
+        if len(parts) == 2:
+            query_id, query_text = parts
+            topics.append(
+                {
+                    "query_id": query_id.strip(),
+                    "query": query_text.strip(),
+                    "narrative": "",
+                }
+            )
+        elif warn_enabled:
+            logger.warning(
+                f"Malformed line in simple topics file {file_path} "
+                f"(expected tab-separated query_id and query): {line[:100]}"
+            )
+
+    # Validate all topics in one call rather than one model per line
+    return TopicSet(
+        topics=_TOPIC_LIST_ADAPTER.validate_python(topics),
+        source_file=str(file_path),
+        format="simple",
+    )
+
+
+# Matches the tag opening a TREC topic line, e.g. "<num>", "<title>" or "</top>"
+_TREC_LINE_TAG_RE = re.compile(r"<(/?)(\w+)>")
+
+
+def _trec_field_text(text: str, tag: str) -> str:
+    """Strip whitespace and an optional closing tag from a field line's text."""
+    return text.strip().removesuffix(f"</{tag}>").rstrip()
+
+
+def _trec_topic_fields(current_topic: dict, file_path: Path) -> dict | None:
+    """Build Topic fields from a finished topic block, or None if incomplete."""
+    query_id = current_topic.get("num", "")
+    query = current_topic.get("query", "")
+
+    # Validate required fields before creating Topic
+    if not query_id:
+        logger.warning(
+            f"Topic block missing required field 'num' (query_id) in {file_path}. "
+            f"Skipping incomplete topic."
+        )
+        return None
+    if not query:
+        logger.warning(
+            f"Topic block with query_id '{query_id}' missing required field 'query' in {file_path}. "
+            f"Skipping incomplete topic."
+        )
+        return None
+
+    narr_lines = current_topic.get("narr")
+    return {
+        "query_id": query_id,
+        "query": query,
+        "narrative": (
+            None if narr_lines is None else " ".join(filter(None, narr_lines))
+        ),
+    }
+
+
+def load_trec_topics(file_path: Path, content: str | None = None) -> TopicSet:
+    """Load topics from legacy TREC format (2024 style).
+
+    Parsed line by line: only a tag at the start of a line is markup, so a
+    literal "<" inside query or narrative text is kept, and other fields such
+    as <title> or <desc> are ignored.
+
+    Args:
+        file_path: Path to the topics file
+        content: File content if already read; read from file_path when omitted
+    """
+    if content is None:
+        content = _read_topics_text(file_path)
 
-def load_trec_topics(file_path: Path) -> TopicSet:
-    """Load topics from legacy TREC format (2024 style)."""
     topics = []
     current_topic = {}
-    current_field = None
+    # Narrative lines being collected, or None outside a <narr> block
+    narr_lines: list[str] | None = None
+
+    for line in content.splitlines():
+        line = line.strip()
+        match = _TREC_LINE_TAG_RE.match(line)
+        closing, tag = match.groups() if match else ("", None)
+
+        if tag == "top":
+            narr_lines = None
+            if not closing:
+                current_topic = {}
+            elif current_topic:
+                fields = _trec_topic_fields(current_topic, file_path)
+                if fields is not None:
+                    topics.append(fields)
+        elif tag in ("num", "query") and not closing:
+            current_topic[tag] = _trec_field_text(line[match.end() :], tag)
+        elif tag == "narr":
+            # Text on the opening line is the "Narrative:" label, not content
+            narr_lines = None if closing else current_topic.setdefault("narr", [])
+        elif narr_lines is not None:
+            if line.endswith("</narr>"):
+                narr_lines.append(line.removesuffix("</narr>").rstrip())
+                narr_lines = None
+            else:
+                narr_lines.append(line)
+
+    # Validate all topics in one call rather than one model per block
+    return TopicSet(
+        topics=_TOPIC_LIST_ADAPTER.validate_python(topics),
+        source_file=str(file_path),
+        format="trec",
+    )
+
+
+def _detect_and_load_topics(file_path: Path) -> TopicSet:
+    """Detect the topic file format and parse it with the matching loader."""
+    if file_path.suffix == ".jsonl":
+        return load_jsonl_topics(file_path)
+
+    # Read once and sniff the first line, then hand the text to the loader
+    content = _read_topics_text(file_path)
+    first_line = content.split("\n", 1)[0].strip()
+    if "\t" in first_line and not first_line.startswith("<"):
+        return load_simple_topics(file_path, content)
+    return load_trec_topics(file_path, content)
+
+
+# Bump when TopicSet's pickled state changes so stale cache entries are ignored
+_TOPIC_CACHE_VERSION = 4
+
+
+def _load_topics_cached(file_path: Path) -> TopicSet:
+    """
+    Load topics through an on-disk pickle cache.
+
+    Entries are keyed by a cache format version and the resolved path,
+    modification time and size, so any change to the topic file produces a
+    cache miss. Cache I/O failures
+    are ignored and simply fall back to parsing the topic file.
+    """
+    stat = file_path.stat()
+    key = hashlib.blake2b(
+        f"{_TOPIC_CACHE_VERSION}:{file_path.resolve()}:{stat.st_mtime_ns}:"
+        f"{stat.st_size}".encode(),
+        digest_size=16,
+    ).hexdigest()
+    cache_file = cache_dir() / "topics" / f"{key}.pkl"
 
     try:
-        with open(file_path, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-
-                if line.startswith("<top>"):
-                    current_topic = {}
-                elif line.startswith("</top>"):
-                    if current_topic:
-                        query_id = current_topic.get("num", "").strip()
-                        query = current_topic.get("query", "").strip()
-
-                        # Validate required fields before creating Topic
-                        if not query_id:
-                            logger.warning(
-                                f"Topic block missing required field 'num' (query_id) in {file_path}. "
-                                f"Skipping incomplete topic."
-                            )
-                        elif not query:
-                            logger.warning(
-                                f"Topic block with query_id '{query_id}' missing required field 'query' in {file_path}. "
-                                f"Skipping incomplete topic."
-                            )
-                        else:
-                            topic = Topic(
-                                query_id=query_id,
-                                query=query,
-                                narrative=current_topic.get("narr"),
-                            )
-                            topics.append(topic)
-                elif line.startswith("<num>"):
-                    current_topic["num"] = (
-                        line.replace("<num>", "").replace("</num>", "").strip()
-                    )
-                elif line.startswith("<query>"):
-                    current_topic["query"] = (
-                        line.replace("<query>", "").replace("</query>", "").strip()
-                    )
-                elif line.startswith("<narr>"):
-                    current_field = "narr"
-                    current_topic["narr"] = ""
-                elif line.startswith("</narr>"):
-                    current_field = None
-                elif current_field == "narr":
-                    current_topic["narr"] += " " + line
-    except FileNotFoundError:
-        raise
-    except OSError as e:
-        raise RuntimeError(f"Error reading topics file {file_path}: {e}") from e
+        with open(cache_file, "rb") as f:
+            return pickle.load(f)
+    except (
+        OSError,
+        pickle.UnpicklingError,
+        EOFError,
+        AttributeError,
+        ImportError,
+    ):
+        # Missing, truncated or stale cache entry: parse the topic file instead
+        pass
+
+    topic_set = _detect_and_load_topics(file_path)
 
-    return TopicSet(topics=topics, source_file=str(file_path), format="trec")
+    # Unwritable cache dir or unpicklable topics: skip caching
+    with contextlib.suppress(OSError, pickle.PicklingError):
+        atomic_write_bytes(
+            cache_file, pickle.dumps(topic_set, protocol=pickle.HIGHEST_PROTOCOL)
+        )
+
+    return topic_set
 
 
 def load_topics(file_path: Path) -> TopicSet:
-    """Auto-detect format and load topics."""
+    """
+    Auto-detect format and load topics.
+
+    Set EVAL_CLI_TOPIC_CACHE=1 to reuse parsed topic sets across runs from
+    a pickle cache under the eval CLI cache directory.
+    """
     if not file_path.exists():
         raise FileNotFoundError(f"Topic file not found: {file_path}")
 
-    if file_path.suffix == ".jsonl":
-        return load_jsonl_topics(file_path)
-    else:
-        # Check if it's simple tab-separated format
-        try:
-            with open(file_path, encoding="utf-8") as f:
-                first_line = f.readline().strip()
-                if "\t" in first_line and not first_line.startswith("<"):
-                    return load_simple_topics(file_path)
-        except FileNotFoundError:
-            raise
-        except OSError as e:
-            raise RuntimeError(f"Error reading topics file {file_path}: {e}") from e
-        return load_trec_topics(file_path)
+    if os.getenv("EVAL_CLI_TOPIC_CACHE", "").lower() in ("1", "true", "yes"):
+        return _load_topics_cached(file_path)
+    return _detect_and_load_topics(file_path)
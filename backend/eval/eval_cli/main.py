@@ -29,28 +29,51 @@ Example usage:
 For detailed documentation, see backend/eval/README.md
 """
 
+import importlib
 import logging
 import sys
 
 import typer
 from rich.console import Console
 
-# Import command modules
-from eval_cli.commands import benchmark, generate, pipeline, runs, score, topics
+# Subcommand name -> module in eval_cli.commands, in help display order
+_SUBCOMMANDS = ("topics", "generate", "runs", "score", "benchmark", "pipeline")
 
-app = typer.Typer(
-    name="eval",
-    help="TREC RAG Evaluation CLI",
-    add_completion=False,
-)
 console = Console()
 
-app.add_typer(topics.app, name="topics")
-app.add_typer(generate.app, name="generate")
-app.add_typer(runs.app, name="runs")
-app.add_typer(score.app, name="score")
-app.add_typer(benchmark.app, name="benchmark")
-app.add_typer(pipeline.app, name="pipeline")
+
+def create_app(argv: list[str] | None = None) -> typer.Typer:
+    """
+    Build the CLI app and register its subcommands.
+
+    When the invoked subcommand can be read from argv, only its module is
+    imported, so a single command does not pay for every other command's
+    imports. Without argv, or when no subcommand is given (e.g. --help), all
+    subcommands are registered.
+
+    Args:
+        argv: Command line arguments, including the program name
+
+    Returns:
+        Typer app ready to be invoked
+    """
+    app = typer.Typer(
+        name="eval",
+        help="TREC RAG Evaluation CLI",
+        add_completion=False,
+    )
+    requested = next((arg for arg in (argv or [])[1:] if not arg.startswith("-")), None)
+    names = (requested,) if requested in _SUBCOMMANDS else _SUBCOMMANDS
+    for name in names:
+        module = importlib.import_module(f"eval_cli.commands.{name}")
+        app.add_typer(module.app, name=name)
+    return app
+
+
+def main() -> None:
+    """Console script entry point: build the app for sys.argv and run it."""
+    create_app(sys.argv)()
+
 
 if __name__ == "__main__":
     # Configure logging (after imports, before any logging occurs)
@@ -61,7 +84,7 @@ if __name__ == "__main__":
     )
 
     try:
-        app()
+        main()
     except Exception as e:
         logger = logging.getLogger(__name__)
         logger.exception("Unhandled exception in CLI")
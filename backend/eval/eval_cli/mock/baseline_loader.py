@@ -2,10 +2,10 @@
 Baseline loader for organizer baseline runs.
 """
 
-from collections import Counter
+from pathlib import Path
 
 from eval_cli.config import Config
-from eval_cli.io.runs import read_trec_run
+from eval_cli.io.runs import read_run_query_counts, read_trec_run
 from eval_cli.models.runs import TrecRun
 
 
@@ -15,18 +15,26 @@ class BaselineLoader:
     def __init__(self, config: Config):
         self.config = config
 
-    def load_baseline(self, year: str) -> TrecRun:
-        """Load organizer baseline run."""
-        if year not in self.config.paths.baselines:
-            available_years = list(self.config.paths.baselines.keys())
+    def _baseline_path(self, year: str) -> Path:
+        """Resolve and check the baseline run file for a year."""
+        baselines = self.config.paths.baselines
+        baseline_file = baselines.get(year)
+        if baseline_file is None:
+            available_years = list(baselines.keys())
             raise KeyError(
                 f"Unknown baseline year '{year}'. Available years: {available_years}"
             )
-        baseline_path = self.config.get_data_path(self.config.paths.baselines[year])
+        baseline_path = self.config.get_data_path(baseline_file)
 
         if not baseline_path.exists():
             raise FileNotFoundError(f"Baseline file not found: {baseline_path}")
 
+        return baseline_path
+
+    def load_baseline(self, year: str) -> TrecRun:
+        """Load organizer baseline run."""
+        baseline_path = self._baseline_path(year)
+
         # Generate run_id from filename
         run_id = baseline_path.stem
 
@@ -35,12 +43,12 @@ class BaselineLoader:
     def get_baseline_stats(self, year: str) -> dict[str, int | float]:
         """Get baseline performance statistics."""
         try:
-            baseline = self.load_baseline(year)
+            baseline_path = self._baseline_path(year)
         except KeyError:
             raise
 
-        # Count queries and documents using Counter
-        query_counts = Counter(row.query_id for row in baseline.rows)
+        # Count results per query without materializing run rows
+        query_counts = read_run_query_counts(baseline_path)
 
         if len(query_counts) == 0:
             return {
@@ -49,8 +57,9 @@ class BaselineLoader:
                 "total_docs": 0.0,
             }
 
+        total_docs = sum(query_counts.values())
         return {
             "num_queries": float(len(query_counts)),
-            "avg_docs_per_query": float(sum(query_counts.values()) / len(query_counts)),
-            "total_docs": float(len(baseline.rows)),
+            "avg_docs_per_query": float(total_docs / len(query_counts)),
+            "total_docs": float(total_docs),
         }
@@ -2,25 +2,38 @@
 TREC run models and validation.
 """
 
+from collections import Counter
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from operator import attrgetter
+from typing import Annotated
 
-from pydantic import BaseModel, Field
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 # Note: TrecRunRow exists in shared/src/shared/evaluation/runs.py
 # but uses different field names (topic_id, segment_id vs query_id, doc_id)
 # Keeping separate for eval CLI which uses query_id/doc_id convention
 
 
-class TrecRunRow(BaseModel):
-    """Single line in TREC run file."""
+@dataclass(slots=True, frozen=True, kw_only=True)
+class TrecRunRow:
+    """Single line in TREC run file.
+
+    A slotted dataclass rather than a BaseModel: runs hold up to 100 rows per
+    query, and the loaders construct rows directly after checking values
+    themselves. The Field constraints still apply whenever rows are validated
+    through pydantic (e.g. TrecRun built from dicts).
+    """
 
     query_id: str
     q0: str = "Q0"  # Literal "Q0" required by TREC format
     doc_id: str
-    rank: int = Field(gt=0, description="Rank must be greater than 0")
-    score: float = Field(
-        allow_inf_nan=False, description="Score must be a finite number"
-    )
+    rank: Annotated[int, Field(gt=0, description="Rank must be greater than 0")]
+    score: Annotated[
+        float,
+        Field(allow_inf_nan=False, description="Score must be a finite number"),
+    ]
     run_id: str
 
     def to_trec_line(self) -> str:
@@ -46,56 +59,106 @@ class RunMetadata(BaseModel):
 class TrecRun(BaseModel):
     """Complete TREC run with metadata."""
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     rows: list[TrecRunRow]
     metadata: RunMetadata
 
+    _by_query: dict[str, list[TrecRunRow]] | None = PrivateAttr(default=None)
+
+    @property
+    def by_query(self) -> dict[str, list[TrecRunRow]]:
+        """Get rows grouped by query_id, each group sorted by rank.
+
+        Built on first access and reused afterwards, since rows are not
+        modified once a run is loaded.
+        """
+        if self._by_query is None:
+            groups: dict[str, list[TrecRunRow]] = {}
+            for row in self.rows:
+                group = groups.get(row.query_id)
+                if group is None:
+                    group = groups[row.query_id] = []
+                group.append(row)
+            for group in groups.values():
+                group.sort(key=attrgetter("rank"))
+            self._by_query = groups
+        return self._by_query
+
+    def _is_valid_format(self) -> bool:
+        """Check all format constraints at once with numpy, without messages."""
+        if not self.rows:
+            return True
+
+        num_rows = len(self.rows)
+        query_ids = np.array([row.query_id for row in self.rows])
+        ranks = np.fromiter((row.rank for row in self.rows), np.int64, num_rows)
+        scores = np.fromiter((row.score for row in self.rows), np.float64, num_rows)
+
+        _, codes, counts = np.unique(query_ids, return_inverse=True, return_counts=True)
+        if counts.max() > 100:
+            return False
+
+        # Sort by (query, rank); ranks must then read 1..count within each query
+        order = np.lexsort((ranks, codes))
+        codes = codes[order]
+        starts = np.cumsum(counts) - counts
+        expected_ranks = np.arange(num_rows) - starts[codes] + 1
+        if not np.array_equal(ranks[order], expected_ranks):
+            return False
+
+        # Scores must not increase as rank worsens within a query
+        scores = scores[order]
+        same_query = codes[1:] == codes[:-1]
+        return not np.any(same_query & (scores[1:] > scores[:-1]))
+
     def validate_format(self) -> list[str]:
         """Validate TREC format constraints."""
+        # Well-formed runs are confirmed in bulk; only build messages on failure
+        if self._is_valid_format():
+            return []
+
         errors = []
 
-        # Check max 100 docs per query
-        query_counts = {}
+        # Group rows by query_id in a single pass, flagging repeated ranks
+        query_rows: dict[str, tuple[list[TrecRunRow], set[int]]] = {}
+        duplicate_rank_errors = []
         for row in self.rows:
-            query_counts[row.query_id] = query_counts.get(row.query_id, 0) + 1
+            group = query_rows.get(row.query_id)
+            if group is None:
+                group = query_rows[row.query_id] = ([], set())
+            rows, seen_ranks = group
+            if row.rank in seen_ranks:
+                duplicate_rank_errors.append(
+                    f"Query {row.query_id} has duplicate rank {row.rank}"
+                )
+            seen_ranks.add(row.rank)
+            rows.append(row)
 
-        for qid, count in query_counts.items():
-            if count > 100:
-                errors.append(f"Query {qid} has {count} results (max 100)")
+        # Check max 100 docs per query
+        for qid, (rows, _) in query_rows.items():
+            if len(rows) > 100:
+                errors.append(f"Query {qid} has {len(rows)} results (max 100)")
 
         # Check unique ranks per query
-        query_ranks = {}
-        for row in self.rows:
-            if row.query_id not in query_ranks:
-                query_ranks[row.query_id] = set()
-            if row.rank in query_ranks[row.query_id]:
-                errors.append(f"Query {row.query_id} has duplicate rank {row.rank}")
-            query_ranks[row.query_id].add(row.rank)
-
-        # Check non-increasing scores per query
-        # First group rows by query_id and sort each group by rank
-        query_rows = {}
-        for row in self.rows:
-            if row.query_id not in query_rows:
-                query_rows[row.query_id] = []
-            query_rows[row.query_id].append(row)
+        errors.extend(duplicate_rank_errors)
 
         # Sort each group by rank (ascending) and check monotonicity
-        for qid, rows in query_rows.items():
+        for qid, (rows, _) in query_rows.items():
             sorted_rows = sorted(rows, key=lambda r: r.rank)
 
             # Check for duplicate or missing ranks
             ranks = [r.rank for r in sorted_rows]
-            if len(ranks) != len(set(ranks)):
-                duplicates = [r for r in ranks if ranks.count(r) > 1]
-                errors.append(
-                    f"Query {qid} has duplicate ranks: {sorted(set(duplicates))}"
-                )
+            rank_counts = Counter(ranks)
+            if len(ranks) != len(rank_counts):
+                duplicates = [r for r, count in rank_counts.items() if count > 1]
+                errors.append(f"Query {qid} has duplicate ranks: {sorted(duplicates)}")
 
             # Check if ranks are consecutive starting from 1
+            # (ranks is already sorted, since sorted_rows is ordered by rank)
             expected_ranks = list(range(1, len(sorted_rows) + 1))
-            actual_ranks = sorted(ranks)
-            if actual_ranks != expected_ranks:
-                missing = set(expected_ranks) - set(actual_ranks)
+            if ranks != expected_ranks:
+                missing = set(expected_ranks).difference(rank_counts)
                 if missing:
                     errors.append(f"Query {qid} has missing ranks: {sorted(missing)}")
 
@@ -33,11 +33,13 @@ class TopicSet(BaseModel):
     format: Literal["jsonl", "trec", "simple"] = Field(description="Topic file format")
 
     _topic_lookup: dict[str, Topic] = PrivateAttr(default_factory=dict)
+    _query_ids: tuple[str, ...] = PrivateAttr(default=())
 
     @model_validator(mode="after")
     def build_lookup(self) -> "TopicSet":
-        """Build O(1) lookup dict after validation."""
+        """Build O(1) lookup dict and query ID list after validation."""
         self._topic_lookup = {topic.query_id: topic for topic in self.topics}
+        self._query_ids = tuple(topic.query_id for topic in self.topics)
         return self
 
     def __len__(self) -> int:
@@ -48,11 +50,20 @@ class TopicSet(BaseModel):
         """Iterate over topics."""
         return iter(self.topics)
 
+    def __contains__(self, query_id: object) -> bool:
+        """Check whether a query ID is present (O(1) lookup)."""
+        return query_id in self._topic_lookup
+
     def get_by_id(self, query_id: str) -> Topic | None:
         """Get topic by query ID (O(1) lookup)."""
         return self._topic_lookup.get(query_id)
 
+    @property
+    def query_id_tuple(self) -> tuple[str, ...]:
+        """Get all query IDs in topic order, without copying."""
+        return self._query_ids
+
     @property
     def query_ids(self) -> list[str]:
-        """Get all query IDs."""
-        return [t.query_id for t in self.topics]
+        """Get all query IDs as a fresh list, so callers may modify it freely."""
+        return list(self._query_ids)
@@ -2,20 +2,10 @@
 Custom metrics for evaluation.
 """
 
-from collections import defaultdict
-
 from eval_cli.io.qrels import Qrels
 from eval_cli.models.runs import TrecRun
 
 
-def _group_by_query(trec_run: TrecRun) -> dict[str, list]:
-    """Group TREC run rows by query_id."""
-    query_results = defaultdict(list)
-    for row in trec_run.rows:
-        query_results[row.query_id].append(row)
-    return dict(query_results)
-
-
 def compute_hitrate_10(trec_run: TrecRun, qrels: Qrels) -> float:
     """Compute HitRate@10 (binary success in top 10)."""
     if not trec_run.rows:
@@ -24,12 +14,10 @@ def compute_hitrate_10(trec_run: TrecRun, qrels: Qrels) -> float:
     successful_queries = 0
     total_queries = 0
 
-    # Group run rows by query
-    query_results = _group_by_query(trec_run)
-
-    for query_id, results in query_results.items():
+    # Run rows grouped by query, already sorted by rank
+    for query_id, results in trec_run.by_query.items():
         # Get top 10 results
-        top_10_docs = {row.doc_id for row in sorted(results, key=lambda x: x.rank)[:10]}
+        top_10_docs = {row.doc_id for row in results[:10]}
 
         # Check if any relevant doc is in top 10
         relevant_docs = qrels.get_relevant_docs(query_id)
@@ -59,10 +47,7 @@ def compute_coverage_stats(trec_run: TrecRun, qrels: Qrels) -> dict[str, int]:
         "retrieved_relevant_docs": 0,
     }
 
-    # Group run rows by query
-    query_results = _group_by_query(trec_run)
-
-    for query_id, results in query_results.items():
+    for query_id, results in trec_run.by_query.items():
         relevant_docs = qrels.get_relevant_docs(query_id)
 
         if relevant_docs:
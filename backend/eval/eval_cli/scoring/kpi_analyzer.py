@@ -2,9 +2,13 @@
 KPI analyzer for comparing metrics against targets.
 """
 
+from collections import Counter
+
+import numpy as np
 from rich import box
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
+from rich.text import Text
 
 from eval_cli.config import Config
 from eval_cli.models.reports import (
@@ -13,10 +17,49 @@ from eval_cli.models.reports import (
     OverallStatus,
 )
 
+_console = Console()
+
+# Fits the formatted values (e.g. "-0.123", "N/A") and column headers
+_NUMERIC_COLUMN_WIDTH = 7
+
+# Status labels indexed by the codes computed in analyze_metrics
+_STATUSES = ("pass", "warn", "fail", "unknown")
+
+_STATUS_SYMBOLS = {
+    "pass": "✓",
+    "warn": "⚠",
+    "fail": "✗",
+    "unknown": "?",
+}
+
+_STATUS_COLORS = {
+    "pass": "green",
+    "warn": "yellow",
+    "fail": "red",
+    "unknown": "white",
+}
+
 
 class KPIAnalyzer:
     """Analyze system-wide metrics against KPI targets."""
 
+    # Key system metrics as (metric name, "all."-prefixed fallback key, display name)
+    _KEY_METRICS: tuple[tuple[str, str, str], ...] = tuple(
+        (metric_name, f"all.{metric_name}", display_name)
+        for metric_name, display_name in (
+            ("ndcg_cut_10", "nDCG@10"),
+            ("ndcg_cut_25", "nDCG@25"),
+            ("ndcg_cut_50", "nDCG@50"),
+            ("ndcg_cut_100", "nDCG@100"),
+            ("map_cut_100", "MAP@100"),
+            ("recip_rank", "MRR@10"),
+            ("recall_25", "Recall@25"),
+            ("recall_50", "Recall@50"),
+            ("recall_100", "Recall@100"),
+            ("hitrate_10", "HitRate@10"),
+        )
+    )
+
     def __init__(self, config: Config):
         self.config = config
         self.targets = config.metrics.targets
@@ -28,55 +71,50 @@ class KPIAnalyzer:
         - 'all': overall nDCG@10 across all queries
         - Key system KPIs: ndcg_cut_10, map_cut_100, recip_rank, etc.
         """
-        metric_values = []
-
-        # Focus on the key system metrics
-        key_metrics = {
-            "ndcg_cut_10": "nDCG@10",
-            "ndcg_cut_25": "nDCG@25",
-            "ndcg_cut_50": "nDCG@50",
-            "ndcg_cut_100": "nDCG@100",
-            "map_cut_100": "MAP@100",
-            "recip_rank": "MRR@10",
-            "recall_25": "Recall@25",
-            "recall_50": "Recall@50",
-            "recall_100": "Recall@100",
-            "hitrate_10": "HitRate@10",
-        }
-
-        for metric_name, display_name in key_metrics.items():
-            value = metrics.get(metric_name, metrics.get(f"all.{metric_name}", 0.0))
-            target = self.targets.get(metric_name)
-
-            # Determine status
-            if target is None:
-                status = "unknown"
-            elif value >= target:
-                status = "pass"
-            elif value >= target * 0.9:  # Within 10% of target
-                status = "warn"
-            else:
-                status = "fail"
-
-            metric_value = MetricValue(
+        # Classify all metrics at once; a missing target is NaN and maps to unknown
+        values = [
+            (
+                metrics[metric_name]
+                if metric_name in metrics
+                else metrics.get(fallback_key, 0.0)
+            )
+            for metric_name, fallback_key, _ in self._KEY_METRICS
+        ]
+        targets = [
+            self.targets.get(metric_name) for metric_name, _, _ in self._KEY_METRICS
+        ]
+        value_array = np.array(values, dtype=np.float64)
+        target_array = np.array(targets, dtype=np.float64)
+        status_codes = np.select(
+            [
+                np.isnan(target_array),
+                value_array >= target_array,
+                value_array >= target_array * 0.9,  # Within 10% of target
+            ],
+            [3, 0, 1],
+            default=2,
+        )
+
+        return [
+            MetricValue(
                 name=display_name,
                 value=value,
                 target=target,
-                status=status,
+                status=_STATUSES[status_code],
                 higher_is_better=True,
             )
-            metric_values.append(metric_value)
-
-        return metric_values
+            for (_, _, display_name), value, target, status_code in zip(
+                self._KEY_METRICS, values, targets, status_codes.tolist(), strict=True
+            )
+        ]
 
     def create_report(self, metrics: dict[str, float]) -> EvaluationReport:
         """Create evaluation report."""
         metric_values = self.analyze_metrics(metrics)
 
         # Count statuses
-        status_counts = {"pass": 0, "warn": 0, "fail": 0, "unknown": 0}
-        for mv in metric_values:
-            status_counts[mv.status] += 1
+        counts = Counter(mv.status for mv in metric_values)
+        status_counts = {status: counts[status] for status in _STATUSES}
 
         return EvaluationReport(
             metrics=metric_values,
@@ -95,56 +133,71 @@ class KPIAnalyzer:
         else:
             return "unknown"
 
-    def print_summary(self, report: EvaluationReport) -> None:
-        """Print KPI summary table."""
-        console = Console()
+    def print_summary(
+        self, report: EvaluationReport, console: Console | None = None
+    ) -> None:
+        """Print KPI summary table.
+
+        Args:
+            report: Evaluation report to summarize
+            console: Console to print to; defaults to the module console
+        """
+        if console is None:
+            console = _console
 
         table = Table(
             title="KPI Analysis Summary",
             box=box.ROUNDED,
             show_header=True,
             header_style="bold magenta",
+            expand=False,
         )
 
         table.add_column("Metric", style="cyan", no_wrap=True)
-        table.add_column("Value", style="white", justify="right")
-        table.add_column("Target", style="blue", justify="right")
-        table.add_column("Status", justify="center")
-        table.add_column("Delta", style="white", justify="right")
+        # Fixed widths for the short numeric columns skip width negotiation
+        table.add_column(
+            "Value",
+            style="white",
+            justify="right",
+            width=_NUMERIC_COLUMN_WIDTH,
+            no_wrap=True,
+        )
+        table.add_column(
+            "Target",
+            style="blue",
+            justify="right",
+            width=_NUMERIC_COLUMN_WIDTH,
+            no_wrap=True,
+        )
+        table.add_column("Status", justify="center", no_wrap=True)
+        table.add_column(
+            "Delta",
+            style="white",
+            justify="right",
+            width=_NUMERIC_COLUMN_WIDTH,
+            no_wrap=True,
+        )
 
         for metric in report.metrics:
             delta = ""
             if metric.target is not None:
                 delta = f"{metric.value - metric.target:+.3f}"
 
-            status_symbol = {
-                "pass": "✓",
-                "warn": "⚠",
-                "fail": "✗",
-                "unknown": "?",
-            }.get(metric.status, "?")
-
             table.add_row(
                 metric.name,
                 f"{metric.value:.3f}",
                 f"{metric.target:.3f}" if metric.target else "N/A",
-                status_symbol,
+                _STATUS_SYMBOLS.get(metric.status, "?"),
                 delta,
             )
 
-        console.print(table)
-
         # Overall status
-        status_colors = {
-            "pass": "green",
-            "warn": "yellow",
-            "fail": "red",
-            "unknown": "white",
-        }
-
-        color = status_colors.get(report.overall_status, "white")
-        console.print(
+        color = _STATUS_COLORS.get(report.overall_status, "white")
+        status_line = Text.from_markup(
             f"\n[bold {color}]"
             f"Overall Status: {report.overall_status.upper()}"
             f"[/bold {color}]"
         )
+
+        # Render table and status together so the summary is written at once
+        console.print(Group(table, status_line))
@@ -2,17 +2,93 @@
 trec_eval wrapper for scoring TREC runs.
 """
 
+import contextlib
+import functools
+import hashlib
+import itertools
+import json
 import logging
+import os
+import re
 import subprocess
+import tempfile
+import threading
 from pathlib import Path
 
 import numpy as np
 import pytrec_eval
 
+from eval_cli.cache import atomic_write_bytes, cache_dir
 from eval_cli.config import Config
+from eval_cli.io.lines import iter_lines
 
 logger = logging.getLogger(__name__)
 
+# Kill trec_eval after this long to avoid indefinite hangs
+_TIMEOUT_SECONDS = 120
+
+# Bump when the cached metrics format changes so stale entries are ignored
+_SCORE_CACHE_VERSION = 1
+
+# Bytes of trec_eval stdout parsed (and of input files hashed) per read
+_READ_CHUNK_BYTES = 1 << 20
+
+# Matches a system-wide trec_eval line: metric name, "all", value
+_ALL_LINE_RE = re.compile(rb"^(\S+)[ \t]+all[ \t]+(\S+)[ \t]*\r?$", re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_qrels_file(qrels_path: str, mtime_ns: int) -> dict[str, dict[str, int]]:
+    """
+    Parse a qrels file into pytrec_eval's {query_id: {doc_id: relevance}} format.
+
+    Equivalent to pytrec_eval.parse_qrel; cached per file modification time.
+    """
+    qrels: dict[str, dict[str, int]] = {}
+    for line in iter_lines(Path(qrels_path)):
+        query_id, _, doc_id, relevance = line.split()
+        query_id = query_id.decode("utf-8")
+        doc_id = doc_id.decode("utf-8")
+        doc_relevance = qrels.get(query_id)
+        if doc_relevance is None:
+            doc_relevance = qrels[query_id] = {}
+        if doc_id in doc_relevance:
+            raise ValueError(f"Duplicate document {doc_id} for query {query_id}")
+        doc_relevance[doc_id] = int(relevance)
+    return qrels
+
+
+@functools.lru_cache(maxsize=8)
+def _build_evaluator(
+    qrels_path: str, mtime_ns: int, metrics: tuple[str, ...]
+) -> pytrec_eval.RelevanceEvaluator:
+    """Build a pytrec_eval evaluator, cached per qrels file version and metrics."""
+    return pytrec_eval.RelevanceEvaluator(
+        _parse_qrels_file(qrels_path, mtime_ns), list(metrics)
+    )
+
+
+def _parse_run(run_path: Path) -> dict[str, dict[str, float]]:
+    """
+    Parse a TREC run file into pytrec_eval's {query_id: {doc_id: score}} format.
+
+    Equivalent to pytrec_eval.parse_run, but reads the memory-mapped file as
+    bytes, decoding only the IDs, and reports duplicate documents with a
+    ValueError instead of an assert.
+    """
+    run: dict[str, dict[str, float]] = {}
+    for line in iter_lines(run_path):
+        query_id, _, doc_id, _, score, _ = line.split()
+        query_id = query_id.decode("utf-8")
+        doc_id = doc_id.decode("utf-8")
+        doc_scores = run.get(query_id)
+        if doc_scores is None:
+            doc_scores = run[query_id] = {}
+        if doc_id in doc_scores:
+            raise ValueError(f"Duplicate document {doc_id} for query {query_id}")
+        doc_scores[doc_id] = float(score)
+    return run
+
 
 class TrecEvalWrapper:
     """Wrapper for trec_eval binary."""
@@ -49,25 +125,73 @@ class TrecEvalWrapper:
 
         cmd.extend([str(qrels_path), str(run_path)])
 
+        if os.getenv("EVAL_CLI_TREC_EVAL_CACHE", "").lower() in ("1", "true", "yes"):
+            return self._score_cached(cmd, qrels_path, run_path, metrics)
+        return self._score(cmd, qrels_path, run_path, metrics)
+
+    def _score_cached(
+        self,
+        cmd: list[str],
+        qrels_path: Path,
+        run_path: Path,
+        metrics: list[str],
+    ) -> dict[str, float]:
+        """
+        Score through an on-disk JSON cache of system-wide metrics.
+
+        Entries are keyed by the trec_eval command (binary, flags and metrics)
+        and the contents of the qrels and run files, so any change to either
+        file produces a cache miss. Cache I/O failures are ignored and simply
+        fall back to scoring.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update("\0".join([str(_SCORE_CACHE_VERSION), *cmd[:-2]]).encode())
+        for path in (qrels_path, run_path):
+            with open(path, "rb") as f:
+                # Prefix each file with its size so contents cannot run together
+                digest.update(f"\0{os.fstat(f.fileno()).st_size}\0".encode())
+                for block in iter(functools.partial(f.read, _READ_CHUNK_BYTES), b""):
+                    digest.update(block)
+        cache_file = cache_dir() / "trec_eval" / f"{digest.hexdigest()}.json"
+
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=120,  # 120 second timeout to avoid indefinite hangs
+            return json.loads(cache_file.read_bytes())
+        except (OSError, ValueError):
+            pass
+
+        system_metrics = self._score(cmd, qrels_path, run_path, metrics)
+
+        # Unwritable cache dir: skip caching
+        with contextlib.suppress(OSError):
+            atomic_write_bytes(
+                cache_file,
+                json.dumps(
+                    {name: float(value) for name, value in system_metrics.items()}
+                ).encode(),
             )
 
-            return self._parse_output(result.stdout)
+        return system_metrics
+
+    def _score(
+        self,
+        cmd: list[str],
+        qrels_path: Path,
+        run_path: Path,
+        metrics: list[str],
+    ) -> dict[str, float]:
+        """Run the trec_eval command, falling back to pytrec_eval without the binary."""
+        try:
+            return self._run_and_parse(cmd)
 
         except subprocess.TimeoutExpired as e:
-            logger.error(f"trec_eval timed out after 120 seconds: {e}")
+            logger.error(f"trec_eval timed out after {_TIMEOUT_SECONDS} seconds: {e}")
             raise RuntimeError(
-                "trec_eval timed out after 120 seconds. This may indicate "
-                "a problem with the input files or system performance."
+                f"trec_eval timed out after {_TIMEOUT_SECONDS} seconds. This may "
+                "indicate a problem with the input files or system performance."
             ) from e
         except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"trec_eval failed: {e.stderr}") from e
+            stderr = e.stderr.decode("utf-8", errors="replace") if e.stderr else ""
+            raise RuntimeError(f"trec_eval failed: {stderr}") from e
         except FileNotFoundError:
             # Fallback to pytrec_eval for developer environments without the binary
             logger.info(
@@ -76,6 +200,55 @@ class TrecEvalWrapper:
             )
             return self._fallback_evaluate(qrels_path, run_path, metrics)
 
+    def _run_and_parse(self, cmd: list[str]) -> dict[str, float]:
+        """Run trec_eval and parse its stdout as it is produced.
+
+        Only complete lines of each chunk are parsed, so memory stays bounded
+        by the chunk size however many per-query lines trec_eval prints.
+
+        Raises:
+            subprocess.TimeoutExpired: If trec_eval runs past the timeout
+            subprocess.CalledProcessError: If trec_eval exits non-zero
+        """
+        timed_out = threading.Event()
+
+        # stderr goes to a file so a chatty process cannot block on a full pipe
+        with tempfile.TemporaryFile() as stderr_file:
+            with subprocess.Popen(
+                cmd, stdout=subprocess.PIPE, stderr=stderr_file
+            ) as process:
+
+                def kill() -> None:
+                    timed_out.set()
+                    process.kill()
+
+                timer = threading.Timer(_TIMEOUT_SECONDS, kill)
+                timer.start()
+                try:
+                    metrics = {}
+                    pending = b""
+                    for chunk in iter(
+                        functools.partial(process.stdout.read, _READ_CHUNK_BYTES), b""
+                    ):
+                        buffer = pending + chunk
+                        end = buffer.rfind(b"\n") + 1
+                        metrics.update(self._parse_output(buffer[:end]))
+                        pending = buffer[end:]
+                    metrics.update(self._parse_output(pending))
+                    returncode = process.wait()
+                finally:
+                    timer.cancel()
+
+            if timed_out.is_set():
+                raise subprocess.TimeoutExpired(cmd, _TIMEOUT_SECONDS)
+            if returncode != 0:
+                stderr_file.seek(0)
+                raise subprocess.CalledProcessError(
+                    returncode, cmd, stderr=stderr_file.read()
+                )
+
+        return metrics
+
     def _fallback_evaluate(
         self,
         qrels_path: Path,
@@ -91,72 +264,66 @@ class TrecEvalWrapper:
         {metric_name: mean(per_query_scores)}
         """
         try:
-            with (
-                open(qrels_path, encoding="utf-8") as qrels_file,
-                open(run_path, encoding="utf-8") as run_file,
-            ):
-                try:
-                    qrels_data = pytrec_eval.parse_qrel(qrels_file)
-                    run_data = pytrec_eval.parse_run(run_file)
-                except Exception as e:
-                    raise RuntimeError(
-                        f"Error parsing qrels or run file: {e}. "
-                        f"qrels_path={qrels_path}, run_path={run_path}"
-                    ) from e
+            # Parsed qrels and evaluators are reused while the qrels file is unchanged
+            qrels_key = (str(qrels_path), qrels_path.stat().st_mtime_ns)
+            try:
+                _parse_qrels_file(*qrels_key)
+                run_data = _parse_run(run_path)
+            except OSError:
+                raise
+            except Exception as e:
+                raise RuntimeError(
+                    f"Error parsing qrels or run file: {e}. "
+                    f"qrels_path={qrels_path}, run_path={run_path}"
+                ) from e
+
+            try:
+                evaluator = _build_evaluator(*qrels_key, tuple(metrics))
+                results = evaluator.evaluate(run_data)
+            except Exception as e:
+                raise RuntimeError(
+                    f"Error during pytrec_eval evaluation: {e}. "
+                    f"qrels_path={qrels_path}, run_path={run_path}"
+                ) from e
+
+            # Guard against empty results before averaging
+            if not any(results.values()):
+                logger.warning(
+                    "No metrics computed (empty results). Returning empty metrics dict."
+                )
+                return {}
+
+            # Lay scores out as a (query, metric) matrix; missing entries are NaN
+            metric_names = list(
+                dict.fromkeys(itertools.chain.from_iterable(results.values()))
+            )
+            scores = np.array(
+                [
+                    [query_scores.get(name, np.nan) for name in metric_names]
+                    for query_scores in results.values()
+                ],
+                dtype=np.float64,
+            )
 
-                try:
-                    evaluator = pytrec_eval.RelevanceEvaluator(qrels_data, metrics)
-                    results = evaluator.evaluate(run_data)
-                except Exception as e:
-                    raise RuntimeError(
-                        f"Error during pytrec_eval evaluation: {e}. "
-                        f"qrels_path={qrels_path}, run_path={run_path}"
-                    ) from e
-
-                # Transpose to get {metric_name: list of scores across queries}
-                metrics_by_name = {}
-                for _query_id, query_scores in results.items():
-                    for metric_name, score in query_scores.items():
-                        if metric_name not in metrics_by_name:
-                            metrics_by_name[metric_name] = []
-                        metrics_by_name[metric_name].append(score)
-
-                # Guard against empty results before np.mean
-                if not metrics_by_name:
+            # Mean over finite scores per metric in a single reduction
+            valid = np.isfinite(scores)
+            counts = valid.sum(axis=0)
+            totals = np.where(valid, scores, 0.0).sum(axis=0)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                means = totals / counts
+
+            system_metrics = {}
+            for column, metric_name in enumerate(metric_names):
+                if not counts[column]:
                     logger.warning(
-                        "No metrics computed (empty results). Returning empty metrics dict."
+                        f"No valid scores for metric '{metric_name}' "
+                        f"across {len(results)} queries"
                     )
-                    return {}
-
-                # Compute system-wide (mean) metrics with defensive parsing
-                system_metrics = {}
-                for metric_name, scores in metrics_by_name.items():
-                    if scores:
-                        # Filter out invalid values before computing mean
-                        valid_scores = []
-                        for score in scores:
-                            try:
-                                score_float = float(score)
-                                if not (np.isnan(score_float) or np.isinf(score_float)):
-                                    valid_scores.append(score_float)
-                            except (ValueError, TypeError) as e:
-                                logger.warning(
-                                    f"Invalid score value for metric '{metric_name}': "
-                                    f"{score} (type: {type(score)}). Error: {e}"
-                                )
-
-                        if valid_scores:
-                            system_metrics[metric_name] = np.mean(valid_scores)
-                        else:
-                            logger.warning(
-                                f"No valid scores for metric '{metric_name}' "
-                                f"after filtering {len(scores)} total scores"
-                            )
-                            system_metrics[metric_name] = np.nan
-                    else:
-                        system_metrics[metric_name] = np.nan
-
-                return system_metrics
+                    system_metrics[metric_name] = np.nan
+                else:
+                    system_metrics[metric_name] = means[column]
+
+            return system_metrics
 
         except OSError as e:
             raise RuntimeError(
@@ -164,36 +331,33 @@ class TrecEvalWrapper:
                 f"qrels_path={qrels_path}, run_path={run_path}"
             ) from e
 
-    def _parse_output(self, output: str) -> dict[str, float]:
-        """Parse trec_eval output.
+    def _parse_output(self, output: bytes) -> dict[str, float]:
+        """Parse raw trec_eval output.
 
         trec_eval outputs lines like:
         'ndcg_cut_10    all    0.3456'
         'ndcg_cut_10    2024-145979    0.4613'
         ...
 
-        We want to extract the 'all' (system-wide) metrics.
+        We want to extract the 'all' (system-wide) metrics. Output is scanned
+        as bytes with a regex; only the fields of 'all' lines are decoded.
         """
         metrics = {}
 
-        for line_num, line in enumerate(output.strip().splitlines(), 1):
-            if not line.strip():
+        # Per-query lines never match, so only 'all' lines reach Python
+        for match in _ALL_LINE_RE.finditer(output):
+            metric_name = match.group(1).decode("utf-8", errors="replace")
+            try:
+                value = float(match.group(2))
+            except ValueError as e:
+                logger.warning(
+                    f"Malformed numeric value in trec_eval output: "
+                    f"metric={metric_name}, "
+                    f"raw_value='{match.group(2).decode('utf-8', errors='replace')}', "
+                    f"error={e}"
+                )
                 continue
-            parts = line.split(maxsplit=2)
-            if len(parts) >= 3:
-                metric_name = parts[0].strip()
-                query_or_all = parts[1].strip()
-                try:
-                    value = float(parts[2].strip())
-                except ValueError as e:
-                    logger.warning(
-                        f"Malformed numeric value in trec_eval output line {line_num}: "
-                        f"metric={metric_name}, raw_value='{parts[2].strip()}', error={e}"
-                    )
-                    continue
 
-                # Only store the 'all' (system-wide) metrics
-                if query_or_all == "all":
-                    metrics[metric_name] = value
+            metrics[metric_name] = value
 
         return metrics
@@ -66,8 +66,9 @@ def main() -> int:
     )
 
     try:
-        # Run the pipeline for all modes
-        run_all_modes(args.topics)
+        # Run the pipeline for all modes; they execute concurrently. Pass every
+        # option explicitly, since the typer defaults are not plain values
+        run_all_modes(args.topics, experiment_id=None, output_dir=None, top_k=100)
         console.print("[bold green]✓ Evaluation completed successfully![/bold green]")
 
     except Exception as e:
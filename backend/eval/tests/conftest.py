@@ -14,7 +14,7 @@ from eval_cli.io.topics import TopicSet
 logger = logging.getLogger(__name__)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def config() -> Config:
     """Load test configuration."""
     try:
@@ -25,13 +25,13 @@ def config() -> Config:
         pytest.fail(f"Error loading configuration: {e}")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_data_dir() -> Path:
     """Get test data directory."""
     return Path(__file__).parent / "fixtures"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_topics_trec(test_data_dir: Path) -> TopicSet:
     """Load sample TREC topics."""
     from eval_cli.io.topics import load_topics
@@ -46,7 +46,7 @@ def sample_topics_trec(test_data_dir: Path) -> TopicSet:
         pytest.fail(f"Error loading topics fixture: {e}")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_topics_jsonl(test_data_dir: Path) -> TopicSet:
     """Load sample JSONL topics."""
     from eval_cli.io.topics import load_topics
@@ -61,7 +61,7 @@ def sample_topics_jsonl(test_data_dir: Path) -> TopicSet:
         pytest.fail(f"Error loading topics fixture: {e}")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_qrels(test_data_dir: Path) -> Qrels:
     """Load sample qrels.
 
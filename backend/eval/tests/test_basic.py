@@ -4,10 +4,16 @@ Basic tests for the evaluation CLI.
 
 from pathlib import Path
 
+import pytest
+
 from eval_cli.config import Config
 from eval_cli.io.qrels import load_qrels
 from eval_cli.io.topics import load_topics
+from eval_cli.models.runs import RunMetadata, TrecRun, TrecRunRow
 from eval_cli.models.topics import Topic, TopicSet
+from eval_cli.scoring.custom_metrics import compute_hitrate_10
+from eval_cli.scoring.kpi_analyzer import KPIAnalyzer
+from eval_cli.scoring.trec_eval import TrecEvalWrapper
 
 
 def test_config_loading() -> None:
@@ -63,3 +69,208 @@ def test_topic_set() -> None:
     assert topic_set.get_by_id("1") is not None
     assert topic_set.get_by_id("3") is None
     assert topic_set.query_ids == ["1", "2"]
+    assert topic_set.query_id_tuple == ("1", "2")
+    assert topic_set.query_id_tuple is topic_set.query_id_tuple
+    # Mutating the returned list must not affect the topic set
+    topic_set.query_ids.append("3")
+    assert topic_set.query_ids == ["1", "2"]
+    assert "1" in topic_set
+    assert "3" not in topic_set
+
+
+def test_trec_run_validate_format() -> None:
+    """Test TREC run format validation."""
+    metadata = RunMetadata(
+        run_id="run",
+        config_snapshot={},
+        topic_source="test.txt",
+        retrieval_mode="mock",
+        top_k=3,
+        num_queries=2,
+    )
+
+    def make_rows(qid: str, ranks: list[int], scores: list[float]) -> list:
+        return [
+            TrecRunRow(
+                query_id=qid, doc_id=f"d{rank}", rank=rank, score=score, run_id="run"
+            )
+            for rank, score in zip(ranks, scores, strict=True)
+        ]
+
+    valid = TrecRun(
+        rows=make_rows("1", [2, 1, 3], [0.5, 0.9, 0.5]) + make_rows("2", [1], [0.1]),
+        metadata=metadata,
+    )
+    assert valid.validate_format() == []
+
+    invalid = TrecRun(rows=make_rows("1", [1, 3], [0.5, 0.9]), metadata=metadata)
+    assert invalid.validate_format() == [
+        "Query 1 has missing ranks: [2]",
+        "Query 1 has increasing scores: rank 1 score 0.500000 < rank 3 score 0.900000",
+    ]
+
+
+def test_hitrate_10(sample_qrels) -> None:
+    """Test HitRate@10 only counts relevant docs within the top 10 ranks."""
+    query_id = sorted(sample_qrels.get_query_ids())[0]
+    relevant_doc = next(iter(sample_qrels.get_relevant_docs(query_id)))
+    rows = [
+        TrecRunRow(
+            query_id=query_id,
+            doc_id=relevant_doc if rank == 11 else f"other_{rank}",
+            rank=rank,
+            score=1.0 / rank,
+            run_id="run",
+        )
+        for rank in range(11, 0, -1)
+    ]
+    metadata = RunMetadata(
+        run_id="run",
+        config_snapshot={},
+        topic_source="test.txt",
+        retrieval_mode="mock",
+        top_k=11,
+        num_queries=1,
+    )
+    trec_run = TrecRun(rows=rows, metadata=metadata)
+    assert [row.rank for row in trec_run.by_query[query_id]] == list(range(1, 12))
+    assert compute_hitrate_10(trec_run, sample_qrels) == 0.0
+
+
+def test_trec_eval_fallback(config: Config, tmp_path: Path) -> None:
+    """Test pytrec_eval fallback scoring when the trec_eval binary is missing."""
+    qrels_path = tmp_path / "qrels.txt"
+    qrels_path.write_text("q1 0 d1 1\nq1 0 d2 0\nq2 0 d3 2\n")
+    run_path = tmp_path / "run.tsv"
+    run_path.write_text(
+        "q1\tQ0\td1\t1\t0.9\trun\nq1\tQ0\td2\t2\t0.5\trun\nq2\tQ0\td9\t1\t0.7\trun\n"
+    )
+
+    trec_eval = TrecEvalWrapper(config)
+    trec_eval.binary_path = tmp_path / "missing_trec_eval"
+    metrics = trec_eval.evaluate(qrels_path, run_path, ["recip_rank", "ndcg_cut_10"])
+    assert metrics == {"recip_rank": 0.5, "ndcg_cut_10": 0.5}
+    # Repeat calls reuse the cached evaluator and give the same result
+    assert (
+        trec_eval.evaluate(qrels_path, run_path, ["recip_rank", "ndcg_cut_10"])
+        == metrics
+    )
+
+
+def test_trec_eval_parse_output(config: Config) -> None:
+    """Test only system-wide metrics are taken from raw trec_eval output."""
+    output = (
+        b"runid                 \tall\trun\n"
+        b"ndcg_cut_10           \tq1\t0.4613\n"
+        b"ndcg_cut_10           \tall\t0.3456\n"
+        b"recip_rank            \tall\t0.5000\n"
+    )
+    metrics = TrecEvalWrapper(config)._parse_output(output)
+    assert metrics == {"ndcg_cut_10": 0.3456, "recip_rank": 0.5}
+
+
+def test_trec_eval_binary_output_streamed(
+    config: Config, tmp_path: Path, monkeypatch
+) -> None:
+    """Test metrics are parsed across stdout chunk boundaries of the binary."""
+    from eval_cli.scoring import trec_eval as trec_eval_module
+
+    qrels_path = tmp_path / "qrels.txt"
+    qrels_path.write_text("q1 0 d1 1\n")
+    run_path = tmp_path / "run.tsv"
+    run_path.write_text("q1\tQ0\td1\t1\t0.9\trun\n")
+    binary = tmp_path / "trec_eval"
+    binary.write_text(
+        "#!/bin/sh\n"
+        "printf 'ndcg_cut_10           \\tq1\\t0.4613\\n'\n"
+        "printf 'ndcg_cut_10           \\tall\\t0.3456\\n'\n"
+        "printf 'recip_rank            \\tall\\t0.5000\\n'\n"
+    )
+    binary.chmod(0o755)
+    monkeypatch.setattr(trec_eval_module, "_READ_CHUNK_BYTES", 7)
+
+    trec_eval = TrecEvalWrapper(config)
+    trec_eval.binary_path = binary
+    metrics = trec_eval.evaluate(qrels_path, run_path, ["ndcg_cut_10"])
+    assert metrics == {"ndcg_cut_10": 0.3456, "recip_rank": 0.5}
+
+    binary.write_text("#!/bin/sh\necho 'bad qrels' >&2\nexit 1\n")
+    with pytest.raises(RuntimeError, match="bad qrels"):
+        trec_eval.evaluate(qrels_path, run_path, ["ndcg_cut_10"])
+
+
+def test_trec_eval_score_cache(config: Config, tmp_path: Path, monkeypatch) -> None:
+    """Test cached scores are reused until the run file changes."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setenv("EVAL_CLI_TREC_EVAL_CACHE", "1")
+    qrels_path = tmp_path / "qrels.txt"
+    qrels_path.write_text("q1 0 d1 1\n")
+    run_path = tmp_path / "run.tsv"
+    run_path.write_text("q1\tQ0\td1\t1\t0.9\trun\n")
+    binary = tmp_path / "trec_eval"
+    binary.write_text("#!/bin/sh\nprintf 'recip_rank\\tall\\t0.5000\\n'\n")
+    binary.chmod(0o755)
+
+    trec_eval = TrecEvalWrapper(config)
+    trec_eval.binary_path = binary
+    assert trec_eval.evaluate(qrels_path, run_path, ["recip_rank"]) == {
+        "recip_rank": 0.5
+    }
+
+    binary.write_text("#!/bin/sh\nexit 1\n")
+    assert trec_eval.evaluate(qrels_path, run_path, ["recip_rank"]) == {
+        "recip_rank": 0.5
+    }
+
+    run_path.write_text("q1\tQ0\td2\t1\t0.9\trun\n")
+    with pytest.raises(RuntimeError):
+        trec_eval.evaluate(qrels_path, run_path, ["recip_rank"])
+
+
+def test_kpi_status_classification(config: Config) -> None:
+    """Test metrics are classified against targets with a 10% warn band."""
+    analyzer = KPIAnalyzer(config)
+    analyzer.targets = {"ndcg_cut_10": 0.5, "recip_rank": 0.5, "map_cut_100": 0.5}
+    report = analyzer.create_report(
+        {"ndcg_cut_10": 0.5, "recip_rank": 0.46, "map_cut_100": 0.4}
+    )
+    statuses = {metric.name: metric.status for metric in report.metrics}
+    assert statuses["nDCG@10"] == "pass"
+    assert statuses["MRR@10"] == "warn"
+    assert statuses["MAP@100"] == "fail"
+    assert statuses["Recall@25"] == "unknown"
+    assert report.overall_status == "fail"
+
+
+def test_config_yaml_cache(tmp_path: Path, monkeypatch) -> None:
+    """Test parsed YAML is cached as JSON and invalidated on modification."""
+    import os
+
+    from eval_cli.cache import cache_dir
+    from eval_cli.config import _read_config_data
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("api:\n  timeout: 10\n", encoding="utf-8")
+
+    # The cache is opt-in
+    assert _read_config_data(config_path) == {"api": {"timeout": 10}}
+    assert not cache_dir().exists()
+
+    monkeypatch.setenv("EVAL_CLI_CONFIG_CACHE", "1")
+    assert _read_config_data(config_path) == {"api": {"timeout": 10}}
+    assert len(list(cache_dir().glob("*.json"))) == 1
+
+    config_path.write_text("api:\n  timeout: 20\n", encoding="utf-8")
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert _read_config_data(config_path) == {"api": {"timeout": 20}}
+
+
+def test_config_env_api_overrides(monkeypatch) -> None:
+    """Test API key and base URL from the environment override the frozen config."""
+    monkeypatch.setenv("API_KEY", "abc")
+    monkeypatch.setenv("API_BASE_URL", "http://x:1")
+    config = Config.load()
+    assert config.api.api_key.get_secret_value() == "abc"
+    assert config.api.base_url == "http://x:1"
@@ -0,0 +1,206 @@
+"""
+Tests for qrels and TREC run I/O.
+"""
+
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from eval_cli.io import batch
+from eval_cli.io.batch import load_all
+from eval_cli.io.qrels import _parse_qrels_lines, load_qrels
+from eval_cli.io.runs import (
+    _parse_run_lines,
+    read_run_query_counts,
+    read_trec_run,
+    write_trec_run,
+)
+from eval_cli.io.topics import load_jsonl_topics, load_topics, load_trec_topics
+
+
+def test_qrels_fast_path_matches_line_parser(test_data_dir: Path) -> None:
+    """Test bulk qrels parsing yields the same entries as the line parser."""
+    qrels_path = test_data_dir / "qrels_sample.txt"
+    qrels, stats = load_qrels(qrels_path)
+    expected = _parse_qrels_lines(qrels_path, {"malformed": 0, "invalid_relevance": 0})
+    assert qrels.entries == expected
+    assert stats == {"malformed": 0, "invalid_relevance": 0}
+
+
+def test_qrels_malformed_lines_counted(tmp_path: Path) -> None:
+    """Test malformed qrels lines fall back to the line parser and are counted."""
+    qrels_path = tmp_path / "qrels.txt"
+    qrels_path.write_text("q1 Q0 d1 1\nq1 Q0\nq2 Q0 d2 x\nq2 Q0 d3 -1\nq3 0 d4 2\n")
+    qrels, stats = load_qrels(qrels_path)
+    assert [e.doc_id for e in qrels.entries] == ["d1", "d4"]
+    assert stats == {"malformed": 1, "invalid_relevance": 2}
+
+
+def test_run_fast_path_matches_line_parser(tmp_path: Path) -> None:
+    """Test bulk run parsing yields the same rows as the line parser."""
+    run_path = tmp_path / "run.tsv"
+    run_path.write_text(
+        'q1\tQ0\td"1\t1\t0.900000\trun\n'
+        "q1\tQ0\td2\t2\t0.500000\trun\n"
+        "q2\tQ0\td3\t1\t0.700000\trun\n"
+    )
+    trec_run = read_trec_run(run_path, "run")
+    expected, skipped = _parse_run_lines(run_path)
+    assert skipped == 0
+    assert trec_run.rows == expected
+    assert trec_run.metadata.num_queries == 2
+    assert trec_run.metadata.top_k == 2
+
+
+def test_run_malformed_lines_skipped(tmp_path: Path) -> None:
+    """Test malformed run lines fall back to the line parser and are skipped."""
+    run_path = tmp_path / "run.tsv"
+    run_path.write_text(
+        "q1\tQ0\td1\t1\t0.9\trun\n"
+        "q1\tQ0\td2\t0\t0.5\trun\n"
+        "q1\tQ0\td3\t3\tnan\trun\n"
+        "q1\tQ0\td4\n"
+    )
+    trec_run = read_trec_run(run_path, "run")
+    assert [r.doc_id for r in trec_run.rows] == ["d1"]
+
+
+def test_out_of_int64_values_fall_back_to_line_parsers(tmp_path: Path) -> None:
+    """Test values too large for int64 load through the line parsers."""
+    huge = 99999999999999999999
+    qrels_path = tmp_path / "qrels.txt"
+    qrels_path.write_text(f"q1 0 d1 {huge}\nq1 0 d2 1\n")
+    qrels, stats = load_qrels(qrels_path)
+    assert [e.relevance for e in qrels.entries] == [huge, 1]
+    assert stats == {"malformed": 0, "invalid_relevance": 0}
+
+    run_path = tmp_path / "run.tsv"
+    run_path.write_text(f"q1\tQ0\td1\t{huge}\t0.9\trun\nq1\tQ0\td2\t2\t0.5\trun\n")
+    assert [r.rank for r in read_trec_run(run_path, "run").rows] == [huge, 2]
+
+
+def test_write_trec_run_round_trip(tmp_path: Path) -> None:
+    """Test written run files read back to the same rows."""
+    run_path = tmp_path / "run.tsv"
+    run_path.write_text("q1\tQ0\td1\t1\t0.900000\trun\nq1\tQ0\td2\t2\t0.500000\trun\n")
+    trec_run = read_trec_run(run_path, "run")
+
+    out_path = tmp_path / "out" / "run.tsv"
+    write_trec_run(trec_run, out_path)
+    assert out_path.read_text() == run_path.read_text()
+
+
+def test_load_trec_topics(tmp_path: Path) -> None:
+    """Test TREC topic blocks are parsed and incomplete blocks skipped."""
+    topics_path = tmp_path / "topics.txt"
+    topics_path.write_text(
+        "<top>\n<num> 101 </num>\n<query> what is x </query>\n"
+        "<narr>\nA relevant doc\n mentions x.\n</narr>\n</top>\n"
+        "<top>\n<num>102</num>\n</top>\n"
+        "<top>\n<num>103</num>\n<query>y?</query>\n</top>\n"
+    )
+    topic_set = load_trec_topics(topics_path)
+    assert topic_set.query_ids == ["101", "103"]
+    assert topic_set.topics[0].query == "what is x"
+    assert topic_set.topics[0].narrative == "A relevant doc mentions x."
+    assert topic_set.topics[1].narrative is None
+
+
+def test_load_trec_topics_keeps_angle_brackets(tmp_path: Path) -> None:
+    """Test "<" inside query and narrative text is not treated as a tag."""
+    topics_path = tmp_path / "topics.txt"
+    topics_path.write_text(
+        "<top>\n<num>104</num>\n<query>is a < b</query>\n"
+        "<narr>\nDocs where a < b\nor <em>b</em> wins.\n</narr>\n</top>\n"
+    )
+    topic = load_trec_topics(topics_path).topics[0]
+    assert topic.query == "is a < b"
+    assert topic.narrative == "Docs where a < b or <em>b</em> wins."
+
+
+def test_load_trec_topics_ignores_other_fields(tmp_path: Path) -> None:
+    """Test <title>/<desc> lines and the narrative label stay out of fields."""
+    topics_path = tmp_path / "topics.txt"
+    topics_path.write_text(
+        "<top>\n<num> 301\n<title> intl crime\n<query> organized crime\n"
+        "<desc> Description:\nWhat is known?\n"
+        "<narr> Narrative:\nA relevant document names a group.\n</top>\n"
+    )
+    topic = load_trec_topics(topics_path).topics[0]
+    assert topic.query_id == "301"
+    assert topic.query == "organized crime"
+    assert topic.narrative == "A relevant document names a group."
+
+
+def test_load_all_parallel_matches_sequential(
+    test_data_dir: Path, tmp_path: Path, monkeypatch
+) -> None:
+    """Test process-pool loading returns the same results as sequential loading."""
+    topics_path = test_data_dir / "topics_sample.jsonl"
+    qrels_path = test_data_dir / "qrels_sample.txt"
+    run_path = tmp_path / "run.tsv"
+    run_path.write_text("q1\tQ0\td1\t1\t0.900000\trun\n")
+    expected = load_all([topics_path], [qrels_path], [run_path])
+
+    monkeypatch.setattr(batch, "_PARALLEL_MIN_BYTES", 0)
+    topics, qrels, runs = load_all([topics_path], [qrels_path], [run_path])
+    assert topics[topics_path].topics == expected[0][topics_path].topics
+    assert qrels == expected[1]
+    assert runs[run_path].rows == expected[2][run_path].rows
+
+
+def test_load_topics_pickle_cache(
+    test_data_dir: Path, tmp_path: Path, monkeypatch
+) -> None:
+    """Test cached topic sets are reused and match a fresh parse."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setenv("EVAL_CLI_TOPIC_CACHE", "1")
+    topics_path = test_data_dir / "topics_sample.jsonl"
+
+    first = load_topics(topics_path)
+    assert len(list((tmp_path / "cache").rglob("*.pkl"))) == 1
+    cached = load_topics(topics_path)
+    assert cached.topics == first.topics
+    assert cached.get_by_id(first.query_ids[0]) == first.topics[0]
+
+    # A truncated cache entry is ignored and rewritten
+    (cache_file,) = (tmp_path / "cache").rglob("*.pkl")
+    cache_file.write_bytes(cache_file.read_bytes()[:10])
+    assert load_topics(topics_path).topics == first.topics
+
+
+def test_load_jsonl_topics_skips_bad_lines(tmp_path: Path) -> None:
+    """Test bad JSONL lines fall back to the line parser and are skipped."""
+    topics_path = tmp_path / "topics.jsonl"
+    topics_path.write_text(
+        '{"query_id": "1", "query": "first"}\n'
+        "\n"
+        "not json\n"
+        '{"query_id": "2"}\n'
+        '{"query_id": "3", "query": "third", "narrative": "n"}\n'
+    )
+    topic_set = load_jsonl_topics(topics_path)
+    assert topic_set.query_ids == ["1", "3"]
+    assert topic_set.get_by_id("3").narrative == "n"
+
+
+def test_load_jsonl_topics_validates_types(tmp_path: Path) -> None:
+    """Test JSONL topics with non-string fields are rejected, not constructed."""
+    topics_path = tmp_path / "topics.jsonl"
+    topics_path.write_text('{"query_id": 1, "query": null}\n')
+    with pytest.raises(ValidationError):
+        load_jsonl_topics(topics_path)
+
+
+def test_read_run_query_counts(tmp_path: Path) -> None:
+    """Test per-query counts match the rows read_trec_run keeps."""
+    run_path = tmp_path / "run.tsv"
+    run_path.write_text(
+        "q1\tQ0\td1\t1\t0.9\trun\nq1\tQ0\td2\t2\t0.5\trun\nq2\tQ0\td3\t1\t0.7\trun\n"
+    )
+    assert read_run_query_counts(run_path) == {"q1": 2, "q2": 1}
+
+    with run_path.open("a") as f:
+        f.write("q3\tQ0\td4\n")
+    assert read_run_query_counts(run_path) == {"q1": 2, "q2": 1}
@@ -0,0 +1,113 @@
+"""
+Tests for the shared run and metric models used by the eval CLI.
+"""
+
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+from shared import CompactMetricSet, MetricValue
+from shared.enums import MetricName
+from shared.evaluation.runs import TrecRun
+
+
+def _write_run(tmp_path: Path, text: str) -> Path:
+    run_path = tmp_path / "run.txt"
+    run_path.write_text(text, encoding="utf-8")
+    return run_path
+
+
+def test_trec_run_from_trec_file(tmp_path: Path) -> None:
+    """Test a run file is parsed into rows, skipping blank lines."""
+    run_path = _write_run(
+        tmp_path, "1 Q0 d1 1 0.9 run\n\n1 Q0 d2 2 0.5 run\n   \n2 Q0 d3 1 1.5 run\n"
+    )
+    run = TrecRun.from_trec_file(run_path)
+    assert [(row.topic_id, row.segment_id, row.rank) for row in run.rows] == [
+        ("1", "d1", 1),
+        ("1", "d2", 2),
+        ("2", "d3", 1),
+    ]
+    assert run.rows[2].score == 1.5
+    assert {row.run_id for row in run.rows} == {"run"}
+    assert {row.q0 for row in run.rows} == {"Q0"}
+
+    assert TrecRun.from_trec_file(_write_run(tmp_path, "\n\n")).rows == []
+
+
+@pytest.mark.parametrize(
+    ("text", "message"),
+    [
+        ("1 Q0 d1 1 0.9 run\n1 Q0 d2 2 run\n", "Row 2 .*expected 6 columns"),
+        ("1 Q0 d1 1 0.9 run\n1 X d2 2 0.5 run\n", "Row 2 .*expected Q0"),
+        ("1 Q0 d1 one 0.9 run\n", "Row 1 .*invalid rank 'one'"),
+        ("1 Q0 d1 1 high run\n", "Row 1 .*invalid rank '1' or score 'high'"),
+        ("1 Q0 d1 1 0.9 run\n1 Q0 d2 101 0.5 run\n", "Row 2 .*rank 101 is outside"),
+        ("1 Q0 d1 0 0.9 run\n", "Row 1 .*rank 0 is outside"),
+        ("1 Q0 d1 1 0.9 run\n1 Q0 d2 1 0.5 run\n", "Duplicate rank 1 in topic 1"),
+        ("1 Q0 d1 1 0.5 run\n1 Q0 d2 2 0.9 run\n", "monotonicity violation"),
+        ("1 Q0 d1 1 0.9 a\n1 Q0 d2 2 0.5 b\n", "Multiple run tags"),
+    ],
+)
+def test_trec_run_from_trec_file_errors(
+    tmp_path: Path, text: str, message: str
+) -> None:
+    """Test malformed run files raise errors naming the problem."""
+    with pytest.raises(ValueError, match=message):
+        TrecRun.from_trec_file(_write_run(tmp_path, text))
+
+
+def test_trec_run_from_columns() -> None:
+    """Test runs built from columns convert values and keep run validation."""
+    run = TrecRun.from_columns(["1", "1"], ["d1", "d2"], ["1", 2], [0.9, "0.5"], "r")
+    assert [(row.rank, row.score) for row in run.rows] == [(1, 0.9), (2, 0.5)]
+
+    with pytest.raises(ValueError, match="Ranks must be between 1 and 100"):
+        TrecRun.from_columns(["1"], ["d1"], [101], [0.9], "r")
+    with pytest.raises(ValidationError, match="Duplicate rank"):
+        TrecRun.from_columns(["1", "1"], ["d1", "d2"], [1, 1], [0.9, 0.5], "r")
+    with pytest.raises(ValueError):
+        TrecRun.from_columns(["1", "1"], ["d1"], [1, 2], [0.9, 0.5], "r")
+
+
+def test_compact_metric_set_round_trip() -> None:
+    """Test CompactMetricSet round-trips MetricValue rows and checks targets."""
+    metrics = [
+        MetricValue(
+            name=MetricName.NDCG_AT_10,
+            value=0.65,
+            higher_is_better=True,
+            target=0.6,
+            pass_flag=True,
+        ),
+        MetricValue(
+            name=MetricName.MAP_AT_100,
+            value=0.28,
+            higher_is_better=True,
+            target=None,
+            pass_flag=None,
+        ),
+    ]
+    compact = CompactMetricSet.from_metrics(metrics)
+    assert compact.names == [MetricName.NDCG_AT_10, MetricName.MAP_AT_100]
+    assert list(compact.rows()) == metrics
+    assert compact.all_targets_met()
+
+    missed = CompactMetricSet.from_metrics(
+        [metrics[0].model_copy(update={"value": 0.5, "pass_flag": False})]
+    )
+    assert not missed.all_targets_met()
+
+    lower = CompactMetricSet.from_metrics(
+        [metrics[1].model_copy(update={"higher_is_better": False, "target": 0.3})]
+    )
+    assert lower.all_targets_met()
+
+    with pytest.raises(ValidationError, match="values has 1 entries"):
+        CompactMetricSet(
+            names=[MetricName.NDCG_AT_10, MetricName.MAP_AT_100],
+            values=[0.5],
+            higher_is_better=[True, True],
+            targets=[None, None],
+            pass_flags=[None, None],
+        )
@@ -1,10 +1,22 @@
+import functools
 import sys
 import os
-import inspect
-import re
-import importlib
-import pkgutil
-from typing import List, Set, Tuple, Type
+import types
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
 from enum import Enum
 from pydantic import BaseModel
 
@@ -14,13 +26,79 @@ project_root = os.path.abspath(os.path.join(script_dir, ".."))
 sys.path.insert(0, project_root)
 sys.path.insert(0, os.path.join(project_root, 'shared', 'src'))
 
-def discover_models_and_enums() -> Tuple[List[Tuple[str, Type[BaseModel]]], List[Tuple[str, Type[Enum]]]]:
+# Per-model (model_name, [(field_name, annotation, display type), ...]) pairs
+FieldTypes = List[Tuple[str, List[Tuple[str, Any, str]]]]
+
+_NONE_TYPE = type(None)
+
+
+def _format_class(ann: type) -> str:
+    """Format a class: enum_-prefixed for enums, bare name for builtin, shared
+    and pydantic classes, dotted path otherwise (e.g. datetime.date)."""
+    if ann is _NONE_TYPE:
+        return "None"
+    if Enum in ann.__mro__:
+        return f"enum_{ann.__name__}"
+    module = ann.__module__
+    if module == "builtins" or module.startswith(("shared.", "pydantic.")):
+        return ann.__qualname__
+    return f"{module}.{ann.__qualname__}"
+
+
+def _format_union(args: Tuple[Any, ...]) -> str:
+    """Format Union/X | Y members as "X | Y"."""
+    return " | ".join(format_annotation(arg) for arg in args)
+
+
+def _format_list(args: Tuple[Any, ...]) -> str:
+    """Format List[T] as list[T]."""
+    return f"list[{', '.join(format_annotation(arg) for arg in args)}]"
+
+
+def _format_dict(args: Tuple[Any, ...]) -> str:
+    """Format Dict[K, V] as map<K, V>."""
+    if len(args) != 2:
+        return "map"
+    return f"map<{format_annotation(args[0])}, {format_annotation(args[1])}>"
+
+
+# Display formatter per generic origin; Literal is a constrained string type
+_ORIGIN_FORMATTERS: Dict[Any, Callable[[Tuple[Any, ...]], str]] = {
+    Literal: lambda args: "str",
+    Union: _format_union,
+    types.UnionType: _format_union,
+    list: _format_list,
+    dict: _format_dict,
+}
+
+
+def format_annotation(ann: Any) -> str:
+    """Format a field annotation for display by walking its typing structure."""
+    origin = get_origin(ann)
+    if origin is not None:
+        formatter = _ORIGIN_FORMATTERS.get(origin)
+        if formatter is not None:
+            return formatter(get_args(ann))
+    elif isinstance(ann, type):
+        return _format_class(ann)
+    return str(ann).replace("typing.", "")
+
+# RetrievalRun references these rather than owning them
+_AGGREGATED_CLASSES = frozenset({"RetrievalRequest", "RetrievalResponse"})
+
+@functools.lru_cache(maxsize=1)
+def discover_models_and_enums() -> Tuple[Tuple[Tuple[str, Type[BaseModel]], ...], Tuple[Tuple[str, Type[Enum]], ...]]:
     """Automatically discover all Pydantic models and enums from the shared package.
+
+    Only submodules imported by ``import shared`` are scanned; the package
+    __init__ re-exports every model, which imports all of them. The result is
+    cached for the process; call ``discover_models_and_enums.cache_clear()``
+    after importing new shared modules.
     
     Returns:
         Tuple containing:
-        - List of (name, model_class) tuples for Pydantic models
-        - List of (name, enum_class) tuples for Enums
+        - Tuple of (name, model_class) tuples for Pydantic models
+        - Tuple of (name, enum_class) tuples for Enums
     """
     models = []
     enums = []
@@ -29,32 +107,36 @@ def discover_models_and_enums() -> Tuple[List[Tuple[str, Type[BaseModel]]], List
         # Import the shared package
         import shared
         
-        # Walk through all modules in the shared package
-        for importer, modname, ispkg in pkgutil.walk_packages(shared.__path__, shared.__name__ + "."):
+        # shared/__init__.py imports every submodule, so read them from sys.modules
+        # instead of walking the package on disk; sorting keeps the walk order
+        prefix = shared.__name__ + "."
+        for modname in sorted(name for name in sys.modules if name.startswith(prefix)):
             try:
-                module = importlib.import_module(modname)
+                module = sys.modules[modname]
+                
+                # Find the classes defined in this module (not imported from elsewhere),
+                # sorted by name like inspect.getmembers
+                classes = sorted(
+                    (name, obj)
+                    for name, obj in vars(module).items()
+                    if isinstance(obj, type) and obj.__module__ == modname
+                )
                 
-                # Find all classes in the module
-                for name, obj in inspect.getmembers(module, inspect.isclass):
-                    # Skip if it's not defined in this module (imported from elsewhere)
-                    if obj.__module__ != modname:
-                        continue
+                # Re-export-only modules such as package __init__ files have none
+                if not classes:
+                    continue
+                
+                for name, obj in classes:
+                    # Scan the class's own MRO instead of dispatching issubclass twice
+                    mro = obj.__mro__
                     
-                    # Protect against TypeError from issubclass with special types
-                    if not isinstance(obj, type):
-                        continue
+                    # Check if it's a Pydantic model
+                    if BaseModel in mro and obj is not BaseModel:
+                        models.append((name, obj))
                     
-                    try:
-                        # Check if it's a Pydantic model
-                        if issubclass(obj, BaseModel) and obj != BaseModel:
-                            models.append((name, obj))
-                        
-                        # Check if it's an enum
-                        elif issubclass(obj, Enum) and obj != Enum:
-                            enums.append((name, obj))
-                    except TypeError:
-                        # Skip generic aliases or special forms that can't be used with issubclass
-                        continue
+                    # Check if it's an enum
+                    elif Enum in mro and obj is not Enum:
+                        enums.append((name, obj))
                         
             except Exception as e:
                 print(f"Warning: Could not import module {modname}: {e}", file=sys.stderr)
@@ -65,218 +147,132 @@ def discover_models_and_enums() -> Tuple[List[Tuple[str, Type[BaseModel]]], List
         print("Make sure the shared package is properly installed")
         sys.exit(1)
     
-    return models, enums
+    return tuple(models), tuple(enums)
 
 
-def generate_enum_definitions(enums: List[Tuple[str, Type[Enum]]]) -> None:
-    """Generate PlantUML enum definitions."""
+def generate_enum_definitions(enums: Sequence[Tuple[str, Type[Enum]]], out: List[str]) -> None:
+    """Append PlantUML enum definitions to out."""
     if enums:
-        print('package "Enums" {')
+        out.append('package "Enums" {')
         for name, enum in enums:
-            print(f"  enum {name} {{")
+            out.append(f"  enum {name} {{")
             for member_name, member_value in enum.__members__.items():
-                print(f"    {member_name}")
-            print(f"  }}")
-        print("}")
-        print("")
+                out.append(f"    {member_name}")
+            out.append(f"  }}")
+        out.append("}")
+        out.append("")
 
 
-def extract_relationships(models: List[Tuple[str, Type[BaseModel]]]) -> Set[str]:
-    """Extract relationships from model fields."""
-    relationships = set()
+def precompute_field_types(
+    models: Sequence[Tuple[str, Type[BaseModel]]]
+) -> FieldTypes:
+    """Collect and format each model's field annotations once.
 
+    Returns:
+        List of (model_name, [(field_name, annotation, display type), ...]) tuples
+    """
+    field_types = []
     for name, model in models:
-        if hasattr(model, "model_fields"):
-            for field_name, field_info in model.model_fields.items():
-                field_type = str(field_info.annotation)
-
-                # Extract relationship information from field types
-                if "shared." in field_type:
-                    # Extract the related class name - handle various formats
-                    related_class = field_type.split(".")[-1]
-                    # Clean up the class name
-                    related_class = (
-                        related_class.replace(">", "")
-                        .replace("'", "")
-                        .replace("]", "")
-                        .replace("[", "")
+        fields = getattr(model, "model_fields", {})
+        field_types.append(
+            (
+                name,
+                [
+                    (
+                        field_name,
+                        field_info.annotation,
+                        format_annotation(field_info.annotation),
                     )
-                    if related_class and related_class not in [
-                        "str",
-                        "int",
-                        "float",
-                        "bool",
-                        "None",
-                    ]:
-                        # Special cases for aggregation relationships
-                        if name == "RetrievalRun" and related_class in [
-                            "RetrievalRequest",
-                            "RetrievalResponse",
-                        ]:
-                            relationships.add(f"{name} o-- {related_class}")
-                        else:
-                            # Determine relationship type based on field type
-                            if "List[" in field_type:
-                                # List fields are composition (strong ownership)
-                                relationships.add(f"{name} *-- {related_class}")
-                            else:
-                                # Single fields are composition (strong ownership)
-                                relationships.add(f"{name} *-- {related_class}")
-
-                # Also check for List[shared.Class] and Optional[shared.Class] patterns
-                list_pattern = r"List\[shared\.(\w+)\]"
-                optional_pattern = r"Optional\[shared\.(\w+)\]"
-
-                list_match = re.search(list_pattern, field_type)
-                if list_match:
-                    relationships.add(f"{name} *-- {list_match.group(1)}")
-
-                optional_match = re.search(optional_pattern, field_type)
-                if optional_match:
-                    relationships.add(f"{name} *-- {optional_match.group(1)}")
+                    for field_name, field_info in fields.items()
+                ],
+            )
+        )
+    return field_types
 
-    return relationships
 
+def _leaf_types(ann: Any) -> Iterator[type]:
+    """Yield the classes nested anywhere in an annotation (e.g. X in list[X] | None)."""
+    if isinstance(ann, type) and get_origin(ann) is None:
+        yield ann
+        return
+    for arg in get_args(ann):
+        yield from _leaf_types(arg)
 
-def generate_model_definitions(models: List[Tuple[str, Type[BaseModel]]]) -> None:
-    """Generate PlantUML class definitions."""
-    for name, model in models:
-        print(f"class {name} {{")
 
-        # Add fields
-        if hasattr(model, "model_fields"):
-            for field_name, field_info in model.model_fields.items():
-                field_type = str(field_info.annotation)
+def extract_relationships(field_types: FieldTypes) -> Set[Tuple[str, str, str]]:
+    """Extract relationships from model fields.
 
-                # Simplify type names for display
-                field_type = field_type.replace("typing.", "").replace(
-                    "typing_extensions.", ""
-                )
-                field_type = field_type.replace("typing.List", "List").replace(
-                    "typing.Optional", "Optional"
-                )
-                field_type = field_type.replace("typing.Dict", "Dict").replace(
-                    "typing.Union", "Union"
-                )
-                field_type = field_type.replace("pydantic.networks.", "")
-                
-                # Handle enum types FIRST - before other replacements that might break the format
-                # Enum annotation format: "<enum 'IndexKind'>" or "<enum 'shared.enums.IndexKind'>"
-                enum_pattern = r"<enum\s+'([^']+)'>"
-                enum_was_processed = False
-                if re.search(enum_pattern, field_type):
-                    matches = re.findall(enum_pattern, field_type)
-                    for enum_path in matches:
-                        # Take last part after dot and add enum_ prefix for clarity
-                        enum_name = enum_path.split(".")[-1]
-                        # Replace the complete enum pattern with prefixed name
-                        field_type = re.sub(r"<enum\s+'" + re.escape(enum_path) + r"'>", f"enum_{enum_name}", field_type)
-                        enum_was_processed = True
-                
-                # Now do class replacements after enum handling, but skip if enum was processed
-                if not enum_was_processed:
-                    field_type = field_type.replace("<class '", "").replace("'>", "")
-                
-                # Detect Dict/dict types BEFORE list conversion
-                is_dict_type = False
-                if "Dict[" in field_type or "dict[" in field_type:
-                    is_dict_type = True
-                
-                # Handle Literal types - convert to str (Literal is a constrained string type)
-                if "Literal[" in field_type:
-                    # Extract values from Literal for documentation if needed, but use str type
-                    # Format: Literal["value1", "value2", ...]
-                    field_type = "str"
-                
-                # Handle complex types (Dict or List)
-                if "[" in field_type and "]" in field_type:
-                    # Extract the inner types - find matching closing bracket for nested types
-                    start_idx = field_type.find("[")
-                    # Find the matching closing bracket by counting nested brackets
-                    bracket_count = 0
-                    end_idx = start_idx
-                    for i in range(start_idx, len(field_type)):
-                        if field_type[i] == "[":
-                            bracket_count += 1
-                        elif field_type[i] == "]":
-                            bracket_count -= 1
-                            if bracket_count == 0:
-                                end_idx = i
-                                break
-                    inner_content = field_type[start_idx+1:end_idx]
-                    
-                    if is_dict_type:
-                        # Dict[K, V] or dict[K, V] -> map<K, V>
-                        # Parse key and value types
-                        if "," in inner_content:
-                            key_type, value_type = inner_content.split(",", 1)
-                            # Clean up types
-                            key_type = key_type.strip()
-                            value_type = value_type.strip()
-                            # Remove shared module prefixes
-                            if "shared." in key_type:
-                                key_type = key_type.split(".")[-1]
-                            if "shared." in value_type:
-                                value_type = value_type.split(".")[-1]
-                            if "." in key_type and not key_type.startswith("shared."):
-                                key_type = key_type.split(".")[-1]
-                            if "." in value_type and not value_type.startswith("shared."):
-                                value_type = value_type.split(".")[-1]
-                            field_type = f"map<{key_type}, {value_type}>"
-                        else:
-                            # Fallback if parsing fails
-                            field_type = "map"
-                    else:
-                        # List[T] -> list[T]
-                        inner_type = inner_content
-                        # Clean up any remaining shared module references
-                        if "shared." in inner_type:
-                            inner_type = inner_type.split(".")[-1]
-                        elif "." in inner_type:
-                            # Handle cases like "retrieval.config.TrecRunRow" -> "TrecRunRow"
-                            inner_type = inner_type.split(".")[-1]
-                        field_type = f"list[{inner_type}]"
+    Returns:
+        Set of (model_name, arrow, related_class) tuples, formatted when printed
+    """
+    relationships = set()
+
+    for name, fields in field_types:
+        for _, annotation, _ in fields:
+            # Any shared model referenced by the field is a related class
+            for leaf in _leaf_types(annotation):
+                if not leaf.__module__.startswith("shared.") or BaseModel not in leaf.__mro__:
+                    continue
+                related_class = leaf.__name__
+                # Special cases for aggregation relationships
+                if name == "RetrievalRun" and related_class in _AGGREGATED_CLASSES:
+                    relationships.add((name, "o--", related_class))
                 else:
-                    # Clean up shared module references - take last part after any dots
-                    if "shared." in field_type:
-                        field_type = field_type.split(".")[-1]
-                
-                print(f"  +{field_name}: {field_type}")
+                    # List and single fields are both composition (strong ownership)
+                    relationships.add((name, "*--", related_class))
+
+    return relationships
 
-        print("}")
-        print("")
+
+def generate_model_definitions(field_types: FieldTypes, out: List[str]) -> None:
+    """Append PlantUML class definitions to out."""
+    for name, fields in field_types:
+        out.append(f"class {name} {{")
+
+        # Add fields
+        for field_name, _, display_type in fields:
+            out.append(f"  +{field_name}: {display_type}")
+
+        out.append("}")
+        out.append("")
 
 
 def generate_uml() -> None:
     """Main UML generation function."""
     try:
-        print("@startuml shared_types")
-        print("title Shared Types - RAG TREC 2025")
-        print("")
+        # Collect every line and write the diagram in one call at the end
+        out = []
+        out.append("@startuml shared_types")
+        out.append("title Shared Types - RAG TREC 2025")
+        out.append("")
 
         # Automatically discover all models and enums
         models, enums = discover_models_and_enums()
 
         # Generate enum definitions first in a grouped box
-        generate_enum_definitions(enums)
+        generate_enum_definitions(enums, out)
+
+        # Stringify field annotations once for both passes below
+        field_types = precompute_field_types(models)
 
         # Generate class definitions
-        generate_model_definitions(models)
+        generate_model_definitions(field_types, out)
 
         # Add dynamically discovered relationships
-        relationships = extract_relationships(models)
-        print("' Dynamic Relationships")
-        for rel in sorted(relationships):
-            print(rel)
+        relationships = extract_relationships(field_types)
+        out.append("' Dynamic Relationships")
+        for name, arrow, related_class in sorted(relationships):
+            out.append(f"{name} {arrow} {related_class}")
 
         # Add conceptual/reference relationships that don't exist as direct field references
-        print("")
-        print("' Reference Relationships")
-        print("DatasetSpec --> IndexTarget : indexes built from")
-        print("ChunkingSpec --> IndexTarget : indexes built from")
-        print("TrecRunRow --> RetrievedSegment : materialises from")
+        out.append("")
+        out.append("' Reference Relationships")
+        out.append("DatasetSpec --> IndexTarget : indexes built from")
+        out.append("ChunkingSpec --> IndexTarget : indexes built from")
+        out.append("TrecRunRow --> RetrievedSegment : materialises from")
 
-        print("@enduml")
+        out.append("@enduml")
+        sys.stdout.write("\n".join(out) + "\n")
 
     except Exception as e:
         print(f"Error generating UML: {e}")
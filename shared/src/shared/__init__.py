@@ -11,6 +11,7 @@ from .backend import ApiInfoResponse, HealthResponse, MetadataResponse
 from .data import ChunkingSpec, DatasetSpec, IndexTarget
 from .enums import IndexKind, MetricName
 from .evaluation import (
+    CompactMetricSet,
     EvaluationDiagnostics,
     EvaluationReport,
     ExperimentManifest,
@@ -50,6 +51,7 @@ __all__ = [
     "RetrievalDiagnostics",
     # Evaluation models
     "MetricValue",
+    "CompactMetricSet",
     "EvaluationDiagnostics",
     "TrecRunRow",
     "RetrievalRun",
@@ -8,6 +8,11 @@ from pydantic import BaseModel, Field, field_validator
 
 from ..enums import IndexKind
 
+_ALLOWED_URI_PREFIXES = ("http://", "https://", "mock://")
+
+# \Z rather than $, which would also accept a trailing newline
+_SNAPSHOT_ID_RE = re.compile(r"^[a-zA-Z0-9_-]+\Z")
+
 
 class IndexTarget(BaseModel):
     """Index target specification."""
@@ -20,11 +25,7 @@ class IndexTarget(BaseModel):
     @classmethod
     def validate_uri(cls: type, v: str) -> str:
         # Accept HTTP URLs or mock:// URIs for testing
-        if not (
-            v.startswith("http://")
-            or v.startswith("https://")
-            or v.startswith("mock://")
-        ):
+        if not v.startswith(_ALLOWED_URI_PREFIXES):
             raise ValueError(
                 f"uri must be http://, https://, or mock:// protocol, got: {v}"
             )
@@ -33,7 +34,7 @@ class IndexTarget(BaseModel):
     @field_validator("snapshot_id")
     @classmethod
     def validate_snapshot_id(cls: type, v: str) -> str:
-        if not re.match(r"^[a-zA-Z0-9_-]+$", v):
+        if not _SNAPSHOT_ID_RE.match(v):
             raise ValueError(
                 f"snapshot_id must contain only alphanumeric, underscore, hyphen: {v}"
             )
@@ -2,12 +2,13 @@
 Evaluation models for metrics, runs, and reports.
 """
 
-from .metrics import EvaluationDiagnostics, MetricValue
+from .metrics import CompactMetricSet, EvaluationDiagnostics, MetricValue
 from .reports import EvaluationReport, ExperimentManifest
 from .runs import RetrievalRun, TrecRunRow
 
 __all__ = [
     "MetricValue",
+    "CompactMetricSet",
     "EvaluationDiagnostics",
     "TrecRunRow",
     "RetrievalRun",
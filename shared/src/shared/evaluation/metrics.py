@@ -2,7 +2,10 @@
 Evaluation metrics and diagnostics.
 """
 
-from pydantic import BaseModel, Field
+from collections.abc import Iterable, Iterator
+from typing import Self
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from ..enums import MetricName
 
@@ -49,3 +52,76 @@ class EvaluationDiagnostics(BaseModel):
     trec_eval_version: str = Field(..., description="trec_eval version")
     runtime_seconds: float = Field(..., description="Evaluation runtime in seconds")
     warnings: list[str] = Field(default_factory=list, description="Warning messages")
+
+
+class CompactMetricSet(BaseModel):
+    """
+    Column-oriented set of metric values, one list entry per metric.
+
+    Holds the same data as a list of MetricValue without one model instance per
+    metric, for aggregating many reports (e.g. building a comparison table).
+    Use from_metrics() to build one and rows() to get MetricValue objects back.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    names: list[MetricName] = Field(..., description="Metric names")
+    values: list[float] = Field(..., description="Metric values")
+    higher_is_better: list[bool] = Field(
+        ..., description="Whether higher values are better, per metric"
+    )
+    targets: list[float | None] = Field(..., description="Target values")
+    pass_flags: list[bool | None] = Field(
+        ..., description="Whether each target was met"
+    )
+
+    @model_validator(mode="after")
+    def validate_lengths(self) -> Self:
+        """Ensure every column has one entry per metric."""
+        size = len(self.names)
+        for column in ("values", "higher_is_better", "targets", "pass_flags"):
+            if len(getattr(self, column)) != size:
+                raise ValueError(
+                    f"{column} has {len(getattr(self, column))} entries, "
+                    f"expected {size} (one per metric name)"
+                )
+        return self
+
+    @classmethod
+    def from_metrics(cls, metrics: Iterable[MetricValue]) -> Self:
+        """Transpose MetricValue rows into columns."""
+        metrics = list(metrics)
+        return cls(
+            names=[metric.name for metric in metrics],
+            values=[metric.value for metric in metrics],
+            higher_is_better=[metric.higher_is_better for metric in metrics],
+            targets=[metric.target for metric in metrics],
+            pass_flags=[metric.pass_flag for metric in metrics],
+        )
+
+    def rows(self) -> Iterator[MetricValue]:
+        """Yield the metrics as MetricValue rows."""
+        for name, value, higher_is_better, target, pass_flag in zip(
+            self.names,
+            self.values,
+            self.higher_is_better,
+            self.targets,
+            self.pass_flags,
+            strict=True,
+        ):
+            yield MetricValue.model_construct(
+                name=name,
+                value=value,
+                higher_is_better=higher_is_better,
+                target=target,
+                pass_flag=pass_flag,
+            )
+
+    def all_targets_met(self) -> bool:
+        """Whether every metric with a target meets it, in its better direction."""
+        return all(
+            target is None or (value >= target if higher else value <= target)
+            for value, higher, target in zip(
+                self.values, self.higher_is_better, self.targets, strict=True
+            )
+        )
@@ -11,7 +11,7 @@ from .runs import RetrievalRun
 class EvaluationReport(BaseModel):
     """Evaluation report."""
 
-    model_config = ConfigDict(frozen=True)
+    model_config = ConfigDict(frozen=True, revalidate_instances="never", extra="forbid")
 
     run_metadata: RetrievalRun = Field(..., description="Run metadata")
     metric_values: list[MetricValue] = Field(..., description="Metric values")
@@ -2,18 +2,27 @@
 TREC run format and retrieval run models.
 """
 
-from pydantic import BaseModel, Field, model_validator
+import sys
+from collections.abc import Iterable
+from pathlib import Path
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from ..retrieval import RetrievalRequest, RetrievalResponse
 
+# TREC runs hold at most 100 results per topic
+_MAX_RANK = 100
+
 
 class TrecRunRow(BaseModel):
     """TREC run format row."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid", populate_by_name=True)
+
     topic_id: str = Field(..., description="Topic/query ID")
     q0: str = Field(default="Q0", description="TREC format field")
     segment_id: str = Field(..., description="Segment ID")
-    rank: int = Field(..., description="Rank (1-100)", ge=1, le=100)
+    rank: int = Field(..., description="Rank (1-100)", ge=1, le=_MAX_RANK)
     score: float = Field(..., description="Score")
     run_id: str = Field(..., description="Run ID")
 
@@ -23,47 +32,145 @@ class TrecRunRow(BaseModel):
 class TrecRun(BaseModel):
     """Full TREC run with validation."""
 
+    model_config = ConfigDict(frozen=True, revalidate_instances="never", extra="forbid")
+
     rows: list[TrecRunRow]
 
+    @classmethod
+    def from_columns(
+        cls,
+        topic_ids: Iterable[str],
+        segment_ids: Iterable[str],
+        ranks: Iterable[int],
+        scores: Iterable[float],
+        run_id: str,
+    ) -> "TrecRun":
+        """
+        Build a run from parallel columns, validating rank bounds once per column.
+
+        Rows are created with model_construct, skipping per-row field validation;
+        the run-level duplicate rank and monotonicity checks still apply. Topic
+        IDs are interned and rows share the run_id and default q0 strings, so
+        these columns hold one string object per distinct value.
+        """
+        ranks = [int(rank) for rank in ranks]
+        if ranks and (min(ranks) < 1 or max(ranks) > _MAX_RANK):
+            raise ValueError(
+                f"Ranks must be between 1 and {_MAX_RANK}, "
+                f"got {min(ranks)}-{max(ranks)}"
+            )
+        rows = [
+            TrecRunRow.model_construct(
+                topic_id=sys.intern(topic_id),
+                segment_id=segment_id,
+                rank=rank,
+                score=float(score),
+                run_id=run_id,
+            )
+            for topic_id, segment_id, rank, score in zip(
+                topic_ids, segment_ids, ranks, scores, strict=True
+            )
+        ]
+        return cls(rows=rows)
+
+    @classmethod
+    def from_trec_file(cls, path: str | Path) -> "TrecRun":
+        """
+        Read a whitespace-separated TREC run file (topic Q0 segment rank score run).
+
+        Each line is split once and its fields are converted into columns for
+        from_columns, so no per-row model validation runs. Malformed lines are
+        reported with their row number, and all lines must share a single run tag.
+        """
+        with open(path, encoding="utf-8") as f:
+            lines = [parts for parts in map(str.split, f) if parts]
+        if not lines:
+            return cls(rows=[])
+
+        topic_ids: list[str] = []
+        segment_ids: list[str] = []
+        ranks: list[int] = []
+        scores: list[float] = []
+        run_tags: set[str] = set()
+        for row_num, parts in enumerate(lines, 1):
+            if len(parts) != 6:
+                raise ValueError(
+                    f"Row {row_num} of {path}: expected 6 columns, got {len(parts)}"
+                )
+            topic_id, q0, segment_id, rank, score, run_tag = parts
+            if q0 != "Q0":
+                raise ValueError(f"Row {row_num} of {path}: expected Q0, got {q0!r}")
+            try:
+                rank_value = int(rank)
+                score_value = float(score)
+            except ValueError:
+                raise ValueError(
+                    f"Row {row_num} of {path}: invalid rank {rank!r} or score {score!r}"
+                ) from None
+            if not 1 <= rank_value <= _MAX_RANK:
+                raise ValueError(
+                    f"Row {row_num} of {path}: rank {rank_value} is outside "
+                    f"1-{_MAX_RANK}"
+                )
+            topic_ids.append(topic_id)
+            segment_ids.append(segment_id)
+            ranks.append(rank_value)
+            scores.append(score_value)
+            run_tags.add(run_tag)
+
+        if len(run_tags) > 1:
+            raise ValueError(f"Multiple run tags in {path}: {sorted(run_tags)}")
+
+        return cls.from_columns(
+            topic_ids, segment_ids, ranks, scores, run_id=run_tags.pop()
+        )
+
     @model_validator(mode="after")
     def validate_monotonicity(self):
         """Ensure scores are non-increasing within each topic and no duplicate ranks."""
-        from collections import defaultdict
-
-        topics = defaultdict(list)
+        # Single pass placing each score into its topic's slot by rank; ranks are
+        # bounded, so duplicates are caught on insert and no sort is needed
+        slots_by_topic: dict[str, list[float | None]] = {}
         for row in self.rows:
-            topics[row.topic_id].append(row)
+            # Rows from model_construct skip the field bounds, so check before indexing
+            if not 1 <= row.rank <= _MAX_RANK:
+                raise ValueError(
+                    f"Rank {row.rank} in topic {row.topic_id} is outside 1-{_MAX_RANK}"
+                )
+            slots = slots_by_topic.get(row.topic_id)
+            if slots is None:
+                slots = slots_by_topic[row.topic_id] = [None] * (_MAX_RANK + 1)
+            if slots[row.rank] is not None:
+                raise ValueError(f"Duplicate rank {row.rank} in topic {row.topic_id}")
+            slots[row.rank] = row.score
 
         eps = 1e-9  # Tolerance for floating-point noise
 
-        for topic_id, rows in topics.items():
-            sorted_rows = sorted(rows, key=lambda r: r.rank)
-
-            # Check for duplicate ranks
-            for i in range(1, len(sorted_rows)):
-                if sorted_rows[i].rank == sorted_rows[i - 1].rank:
-                    raise ValueError(
-                        f"Duplicate rank {sorted_rows[i].rank} in topic {topic_id}: "
-                        f"found at positions {i-1} and {i}"
-                    )
-
-            # Check score monotonicity with epsilon tolerance
-            for i in range(1, len(sorted_rows)):
-                current_score = sorted_rows[i].score
-                previous_score = sorted_rows[i - 1].score
-                if current_score > previous_score + eps:
+        for topic_id, slots in slots_by_topic.items():
+            # Check score monotonicity with epsilon tolerance, in rank order
+            previous_rank = None
+            previous_score = None
+            for rank in range(1, _MAX_RANK + 1):
+                current_score = slots[rank]
+                if current_score is None:
+                    continue
+                if previous_score is not None and current_score > previous_score + eps:
                     raise ValueError(
                         f"Score monotonicity violation in topic {topic_id}: "
-                        f"rank {sorted_rows[i].rank} score {current_score} > "
-                        f"rank {sorted_rows[i-1].rank} score {previous_score} "
+                        f"rank {rank} score {current_score} > "
+                        f"rank {previous_rank} score {previous_score} "
                         f"(tolerance: {eps})"
                     )
+                previous_rank = rank
+                previous_score = current_score
         return self
 
 
 class RetrievalRun(BaseModel):
     """Retrieval run metadata."""
 
+    model_config = ConfigDict(frozen=True, revalidate_instances="never", extra="forbid")
+
     run_id: str = Field(..., description="Run identifier")
     schema_version: str = Field(..., description="Schema version")
     dataset_version: str = Field(..., description="Dataset version")
@@ -23,6 +23,16 @@ class RetrievalConfig(BaseModel):
         description="Weight config (if provided, non-empty, keys match targets)",
     )
 
+    @property
+    def target_ids(self) -> frozenset[str]:
+        """
+        Snapshot IDs of the index targets, for O(1) membership checks.
+
+        Built from index_targets on each access, so it never goes stale after
+        the targets change; keep the result when checking many keys.
+        """
+        return frozenset(target.snapshot_id for target in self.index_targets)
+
     @model_validator(mode="after")
     def validate_config(self) -> Self:
         """Validate retrieval configuration for completeness and consistency."""
@@ -36,24 +46,22 @@ class RetrievalConfig(BaseModel):
             if not self.weights:
                 raise ValueError("weights cannot be an empty dictionary when provided")
 
-            # Check non-negative values
+            # Check non-negative values and keys matching index targets in one pass
+            target_ids = self.target_ids
+            total = 0.0
             for key, weight in self.weights.items():
                 if weight < 0:
                     raise ValueError(
                         f"Weight for '{key}' must be non-negative, got {weight}"
                     )
-
-            # Check keys match index targets
-            target_ids = {target.snapshot_id for target in self.index_targets}
-            for key in self.weights:
                 if key not in target_ids:
                     raise ValueError(
                         f"Weight key '{key}' not found in index_targets "
-                        f"snapshot_ids: {target_ids}"
+                        f"snapshot_ids: {set(target_ids)}"
                     )
+                total += weight
 
             # Check not all zeros
-            total = sum(self.weights.values())
             if math.isclose(total, 0.0, abs_tol=1e-9):
                 raise ValueError("Weights cannot all be zero")
 
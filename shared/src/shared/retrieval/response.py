@@ -2,7 +2,9 @@
 Retrieval response models.
 """
 
-from pydantic import BaseModel, Field
+from typing import Self
+
+from pydantic import BaseModel, ConfigDict, Field
 
 from ..enums import IndexKind
 
@@ -31,6 +33,8 @@ class ProvenanceInfo(BaseModel):
 class RetrievedSegment(BaseModel):
     """Retrieved segment."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid", populate_by_name=True)
+
     segment_id: str = Field(..., description="Segment identifier")
     score: float = Field(..., description="Retrieval score")
     content: str = Field(..., description="Retrieved segment content/text")
@@ -52,6 +56,8 @@ class RetrievalDiagnostics(BaseModel):
 class QueryResult(BaseModel):
     """Result for a single query."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid", populate_by_name=True)
+
     query_id: str = Field(..., description="Query identifier")
     segments: list[RetrievedSegment] = Field(..., description="Retrieved segments")
     diagnostics: RetrievalDiagnostics = Field(..., description="Retrieval diagnostics")
@@ -60,8 +66,26 @@ class QueryResult(BaseModel):
 class RetrievalResponse(BaseModel):
     """Retrieval response."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid", populate_by_name=True)
+
     schema_version: str = Field(..., description="Schema version")
     dataset_version: str = Field(..., description="Dataset version")
     config_hash: str = Field(..., description="Configuration hash")
     request_id: str = Field(..., description="Request identifier")
-    results: list[QueryResult] = Field(..., description="Query results", min_items=1)
+    results: list[QueryResult] = Field(..., description="Query results", min_length=1)
+
+    @classmethod
+    def from_json_bytes(cls, data: bytes | str) -> Self:
+        """
+        Parse and validate a response from raw JSON in one pass.
+
+        Uses pydantic-core's JSON parser directly, skipping the intermediate
+        dicts of json.loads followed by model construction; bulk consumers
+        should prefer this. Malformed JSON raises a ValidationError of type
+        json_invalid.
+        """
+        return cls.model_validate_json(data)
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize the response to UTF-8 JSON without building dicts first."""
+        return self.__pydantic_serializer__.to_json(self)